@@ -0,0 +1,85 @@
+from typing import Optional
+
+import asyncio
+
+import httpx
+from aiolimiter import AsyncLimiter
+
+from app.config.settings import settings
+from app.utils.logging import get_logger
+
+logger = get_logger(__name__)
+
+HTTP_LIMITS = httpx.Limits(max_connections=200, max_keepalive_connections=100)
+HTTP_TIMEOUT = httpx.Timeout(60.0, connect=5.0)
+WARMUP_TIMEOUT = httpx.Timeout(2.0)
+
+_client: Optional[httpx.AsyncClient] = None
+_guards: Optional[tuple[asyncio.AbstractEventLoop, asyncio.Semaphore, AsyncLimiter]] = None
+
+
+def get_http_client() -> httpx.AsyncClient:
+    """
+    Get the process-wide HTTP client for OpenRouter.
+
+    Both adapters share one client so they reuse a single HTTP/2
+    connection pool and TLS session to the OpenRouter host.
+
+    Returns:
+        Shared httpx.AsyncClient bound to the OpenRouter API URL
+    """
+    global _client
+    if _client is None:
+        _client = httpx.AsyncClient(
+            base_url=settings.openrouter_api_url,
+            headers={"Authorization": f"Bearer {settings.openrouter_api_key}"},
+            limits=HTTP_LIMITS,
+            timeout=HTTP_TIMEOUT,
+            http2=True,
+        )
+    return _client
+
+
+def get_request_guards() -> tuple[asyncio.Semaphore, AsyncLimiter]:
+    """
+    Get the concurrency bound and rate limiter for OpenRouter requests.
+
+    In-flight requests are capped and paced under the provider's rate
+    limit, so bursts queue here instead of piling up as 429s and retries.
+    Both primitives are bound to an event loop, so they are created per
+    running loop.
+
+    Returns:
+        Tuple of (semaphore, limiter) to enter around each request
+    """
+    global _guards
+    loop = asyncio.get_running_loop()
+    if _guards is None or _guards[0] is not loop:
+        _guards = (
+            loop,
+            asyncio.Semaphore(settings.openrouter_max_concurrency),
+            AsyncLimiter(settings.openrouter_rpm, 60),
+        )
+    return _guards[1], _guards[2]
+
+
+async def warm_http_client():
+    """
+    Open a pooled connection to OpenRouter ahead of the first request.
+
+    Pays DNS, TLS and HTTP/2 setup at startup instead of on the first user
+    request. Failures are logged and ignored; requests connect lazily anyway.
+    """
+    try:
+        await get_http_client().head("/models", timeout=WARMUP_TIMEOUT)
+        logger.info("OpenRouter connection warmed up")
+    except httpx.HTTPError as e:
+        logger.warning("OpenRouter warmup failed", error=str(e))
+
+
+async def close_http_client():
+    """Close the shared client and its connection pool."""
+    global _client
+    if _client is not None:
+        await _client.aclose()
+        _client = None
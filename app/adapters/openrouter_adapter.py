@@ -1,9 +1,10 @@
 from typing import Any, Optional, Type, TypeVar, Union
 
-from openai import AsyncOpenAI
-from pydantic import BaseModel
+from pydantic import BaseModel, ValidationError
 
+from app.adapters.raw_openrouter import TRANSIENT_ERRORS, chat_completion
 from app.config.settings import settings
+from app.utils.cache import AsyncTTLCache, make_cache_key
 from app.utils.logging import get_logger
 from app.utils.retry_decorator import retry_with_exponential_backoff_async
 
@@ -12,6 +13,12 @@ logger = get_logger(__name__)
 T = TypeVar("T", bound=BaseModel)
 
 EMPTY_RESPONSE_MESSAGE = "Response empty"
+MALFORMED_RESPONSE_MESSAGE = "Response did not match the requested output type"
+
+_response_cache = AsyncTTLCache(
+    maxsize=settings.response_cache_maxsize,
+    ttl=settings.response_cache_ttl_seconds,
+)
 
 
 class OpenRouterAdapterException(Exception):
@@ -28,18 +35,6 @@ class OpenRouterAdapter:
     and structured output support.
     """
 
-    def __init__(self):
-        self.client = AsyncOpenAI(
-            base_url=settings.openrouter_api_url,
-            api_key=settings.openrouter_api_key,
-            max_retries=3,
-        )
-
-    @retry_with_exponential_backoff_async(
-        max_retries=3,
-        base_delay=1.0,
-        exceptions_to_retry=(Exception, OpenRouterAdapterException),
-    )
     async def make_request(
         self,
         *,
@@ -52,6 +47,9 @@ class OpenRouterAdapter:
         """
         Make LLM request with optional structured output.
 
+        Identical requests are served from an in-memory TTL cache and
+        concurrent identical requests share a single upstream call.
+
         Args:
             model: Model identifier (e.g., "openai/gpt-4o-mini")
             messages: Chat messages array
@@ -62,37 +60,64 @@ class OpenRouterAdapter:
         Returns:
             Parsed Pydantic model if output_type provided, else string
         """
-        if output_type:
-            # Use parse method for structured output
-            response = await self.client.chat.completions.parse(
+
+        async def request():
+            return await self._request(
                 model=model,
                 messages=messages,
-                response_format=output_type,
-                max_completion_tokens=max_tokens,
+                output_type=output_type,
+                max_tokens=max_tokens,
+                temperature=temperature,
             )
 
-            if not response.choices[0].message.parsed:
-                raise OpenRouterAdapterException(EMPTY_RESPONSE_MESSAGE)
-
-            return response.choices[0].message.parsed
+        if not settings.response_cache_enabled:
+            return await request()
 
-        # Regular completion without structured output
-        kwargs = {
-            "model": model,
-            "messages": messages,
-        }
+        key = make_cache_key(
+            model,
+            messages,
+            max_tokens,
+            temperature,
+            output_type and output_type.__name__,
+        )
+        return await _response_cache.get_or_set(key, request)
 
-        if max_tokens:
-            kwargs["max_completion_tokens"] = max_tokens
-        if temperature is not None:
-            kwargs["temperature"] = temperature
+    @retry_with_exponential_backoff_async(
+        max_retries=3,
+        base_delay=1.0,
+        exceptions_to_retry=TRANSIENT_ERRORS,
+    )
+    async def _request(
+        self,
+        *,
+        model: str,
+        messages: list[dict[str, Any]],
+        output_type: Optional[Type[T]] = None,
+        max_tokens: Optional[int] = None,
+        temperature: Optional[float] = None,
+    ) -> Union[T, str]:
+        """Perform the uncached LLM request."""
+        try:
+            message = await chat_completion(
+                model=model,
+                messages=messages,
+                output_type=output_type,
+                max_tokens=max_tokens,
+                temperature=temperature,
+            )
+        except ValidationError as exc:
+            # Upstream failure, not a client error; see chat_completion
+            raise OpenRouterAdapterException(MALFORMED_RESPONSE_MESSAGE) from exc
 
-        response = await self.client.chat.completions.create(**kwargs)
+        if output_type:
+            if not message.parsed:
+                raise OpenRouterAdapterException(EMPTY_RESPONSE_MESSAGE)
+            return message.parsed
 
-        if not response.choices[0].message.content:
+        if not message.content:
             raise OpenRouterAdapterException(EMPTY_RESPONSE_MESSAGE)
 
-        return response.choices[0].message.content
+        return message.content
 
 
 # Singleton instance
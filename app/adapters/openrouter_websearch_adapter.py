@@ -1,11 +1,13 @@
 from typing import Any, Optional
 
-from openai import AsyncOpenAI
-from pydantic import BaseModel
+from pydantic import BaseModel, ValidationError
 
+from app.adapters.raw_openrouter import TRANSIENT_ERRORS, chat_completion
 from app.config.settings import settings
 from app.config.model_config import ModelSelector, ModelUseCase
+from app.utils.cache import AsyncTTLCache, make_cache_key
 from app.utils.logging import get_logger
+from app.utils.semantic_cache import create_semantic_cache
 from app.utils.retry_decorator import retry_with_exponential_backoff_async
 
 logger = get_logger(__name__)
@@ -48,6 +50,16 @@ Return your findings as a JSON object with this structure:
 Include 3-5 relevant sources. Focus on authoritative sources like news sites,
 official organizations, and fact-checking websites."""
 
+# Static system message shared by every websearch request
+_SYSTEM_MESSAGE = {"role": "system", "content": WEBSEARCH_SYSTEM_PROMPT}
+
+_search_cache = AsyncTTLCache(
+    maxsize=settings.response_cache_maxsize,
+    ttl=settings.response_cache_ttl_seconds,
+)
+
+semantic_search_cache = create_semantic_cache(list[WebsearchResponse])
+
 
 class OpenRouterWebsearchAdapter:
     """
@@ -60,17 +72,8 @@ class OpenRouterWebsearchAdapter:
     """
 
     def __init__(self):
-        self.client = AsyncOpenAI(
-            base_url=settings.openrouter_api_url,
-            api_key=settings.openrouter_api_key,
-        )
         self.logger = get_logger(self.__class__.__name__)
 
-    @retry_with_exponential_backoff_async(
-        max_retries=3,
-        base_delay=1.0,
-        exceptions_to_retry=(Exception, WebsearchException),
-    )
     async def search(
         self,
         *,
@@ -80,6 +83,9 @@ class OpenRouterWebsearchAdapter:
         """
         Search for evidence using OpenRouter's :online websearch.
 
+        Results for repeated claims are served from an in-memory TTL cache;
+        on a miss, and when enabled, a semantic cache serves reworded claims.
+
         Args:
             query: The claim to search for evidence about
             max_results: Maximum number of results (hint to LLM)
@@ -90,8 +96,42 @@ class OpenRouterWebsearchAdapter:
         # Get websearch model (appends :online suffix)
         model = ModelSelector.get_websearch_model(ModelUseCase.FACT_CHECK_WEBSEARCH)
 
+        scope = f"{model}:{max_results}"
+
+        async def request():
+            return await self._search(
+                model=model, query=query, max_results=max_results
+            )
+
+        async def semantic_request():
+            return await semantic_search_cache.get_or_set(
+                query, request, scope=scope
+            )
+
+        # Exact matches are checked first so they never pay for an embedding
+        factory = request if semantic_search_cache is None else semantic_request
+
+        if not settings.response_cache_enabled:
+            return await factory()
+
+        key = make_cache_key(model, query, max_results)
+        return await _search_cache.get_or_set(key, factory)
+
+    @retry_with_exponential_backoff_async(
+        max_retries=3,
+        base_delay=1.0,
+        exceptions_to_retry=TRANSIENT_ERRORS,
+    )
+    async def _search(
+        self,
+        *,
+        model: str,
+        query: str,
+        max_results: int,
+    ) -> list[WebsearchResponse]:
+        """Perform the uncached websearch request."""
         messages = [
-            {"role": "system", "content": WEBSEARCH_SYSTEM_PROMPT},
+            _SYSTEM_MESSAGE,
             {
                 "role": "user",
                 "content": f"Search for evidence about this claim: {query}\n\nReturn up to {max_results} relevant sources.",
@@ -100,16 +140,20 @@ class OpenRouterWebsearchAdapter:
 
         self.logger.info("Performing websearch", query=query[:50], model=model)
 
-        response = await self.client.chat.completions.parse(
-            model=model,
-            messages=messages,
-            response_format=WebsearchResponseList,
-        )
-
-        if not response.choices[0].message.parsed:
+        try:
+            message = await chat_completion(
+                model=model,
+                messages=messages,
+                output_type=WebsearchResponseList,
+            )
+        except ValidationError as exc:
+            # Upstream failure, not a client error; see chat_completion
+            raise WebsearchException("Malformed websearch response") from exc
+
+        if not message.parsed:
             raise WebsearchException("No response from websearch")
 
-        result = response.choices[0].message.parsed
+        result = message.parsed
 
         self.logger.info(
             "Websearch complete", num_results=len(result.results), query=query[:50]
@@ -0,0 +1,198 @@
+"""Minimal OpenRouter chat-completions client on the shared HTTP pool."""
+
+import functools
+import time
+from dataclasses import dataclass
+from email.utils import parsedate_to_datetime
+from typing import Any, Optional, Type
+
+import httpx
+import orjson
+from pydantic import BaseModel
+
+from app.adapters._client import get_http_client, get_request_guards
+
+JSON_HEADERS = {"Content-Type": "application/json"}
+
+
+class OpenRouterAPIError(Exception):
+    """Raised when OpenRouter returns an error response."""
+
+    def __init__(
+        self, status_code: int, message: str, retry_after: Optional[float] = None
+    ):
+        super().__init__(f"OpenRouter API error {status_code}: {message}")
+        self.status_code = status_code
+        self.retry_after = retry_after
+
+
+class OpenRouterTransientError(OpenRouterAPIError):
+    """Raised for OpenRouter errors worth retrying (timeouts, 429, 5xx)."""
+
+
+RETRYABLE_STATUS_CODES = frozenset({408, 429, 500, 502, 503, 504})
+
+# Errors a retry can fix: network failures and transient API statuses
+TRANSIENT_ERRORS = (httpx.TransportError, OpenRouterTransientError)
+
+
+def api_error(
+    status_code: int, message: str, retry_after: Optional[float] = None
+) -> OpenRouterAPIError:
+    """Build the API error for a status, marking retryable ones as transient."""
+    if status_code in RETRYABLE_STATUS_CODES:
+        return OpenRouterTransientError(status_code, message, retry_after)
+    return OpenRouterAPIError(status_code, message, retry_after)
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """
+    Parse a Retry-After header into seconds.
+
+    Args:
+        value: Header value, either delay-seconds or an HTTP date
+
+    Returns:
+        Seconds to wait, or None when absent or unparseable
+    """
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+    except (TypeError, ValueError):
+        return None
+
+
+@dataclass(frozen=True)
+class ChatMessage:
+    """Assistant message from a chat completion."""
+
+    content: Optional[str]
+    parsed: Optional[Any] = None
+
+
+def _make_strict(schema: dict[str, Any]) -> dict[str, Any]:
+    """Recursively apply OpenAI strict-mode rules to a JSON schema node."""
+    schema = dict(schema)
+    for key in ("properties", "$defs"):
+        if key in schema:
+            schema[key] = {
+                name: _make_strict(node) for name, node in schema[key].items()
+            }
+    for key in ("anyOf", "allOf", "oneOf", "prefixItems"):
+        if key in schema:
+            schema[key] = [_make_strict(node) for node in schema[key]]
+    if isinstance(schema.get("items"), dict):
+        schema["items"] = _make_strict(schema["items"])
+
+    if "properties" in schema:
+        # Strict mode requires every property and forbids extra keys
+        schema["required"] = list(schema["properties"])
+        schema["additionalProperties"] = False
+    if "default" in schema and schema["default"] is None:
+        del schema["default"]
+    return schema
+
+
+def strict_json_schema(output_type: Type[BaseModel]) -> dict[str, Any]:
+    """
+    Build a strict-mode JSON schema for a Pydantic model.
+
+    Args:
+        output_type: Pydantic model class
+
+    Returns:
+        Model JSON schema with all properties required and no extras allowed
+    """
+    return _make_strict(output_type.model_json_schema())
+
+
+@functools.lru_cache(maxsize=32)
+def response_format_for(output_type: Type[BaseModel]) -> dict[str, Any]:
+    """
+    Build a strict json_schema response_format for a Pydantic model.
+
+    Cached per model class, so the schema is generated once rather than on
+    every call. The returned dict is shared and must not be mutated.
+    """
+    return {
+        "type": "json_schema",
+        "json_schema": {
+            "name": output_type.__name__,
+            "schema": strict_json_schema(output_type),
+            "strict": True,
+        },
+    }
+
+
+async def chat_completion(
+    *,
+    model: str,
+    messages: list[dict[str, Any]],
+    output_type: Optional[Type[BaseModel]] = None,
+    max_tokens: Optional[int] = None,
+    temperature: Optional[float] = None,
+) -> ChatMessage:
+    """
+    POST a chat completion to OpenRouter without going through the OpenAI SDK.
+
+    Args:
+        model: Model identifier
+        messages: Chat messages array
+        output_type: Pydantic model for structured output
+        max_tokens: Optional token limit
+        temperature: Optional temperature setting
+
+    Returns:
+        ChatMessage with raw content and, for structured output, the
+        validated model in ``parsed``
+
+    Raises:
+        OpenRouterAPIError: OpenRouter returned an error
+        ValidationError: The model's output does not match output_type.
+            This is an upstream failure, not a bad client request, so
+            callers re-raise it as their own adapter exception rather
+            than letting it reach the 422 validation handler.
+    """
+    payload: dict[str, Any] = {"model": model, "messages": messages}
+    if output_type is not None:
+        payload["response_format"] = response_format_for(output_type)
+    if max_tokens:
+        payload["max_completion_tokens"] = max_tokens
+    if temperature is not None:
+        payload["temperature"] = temperature
+
+    semaphore, limiter = get_request_guards()
+    async with semaphore, limiter:
+        response = await get_http_client().post(
+            "/chat/completions",
+            content=orjson.dumps(payload),
+            headers=JSON_HEADERS,
+        )
+    if response.is_error:
+        raise api_error(
+            response.status_code,
+            response.text,
+            retry_after=parse_retry_after(response.headers.get("Retry-After")),
+        )
+
+    body = orjson.loads(response.content)
+    if "error" in body:
+        error = body["error"]
+        if not isinstance(error, dict):
+            raise OpenRouterAPIError(500, str(error))
+        raise api_error(error.get("code", 500), error.get("message", ""))
+
+    # A body without choices or a message is treated as an empty response
+    choices = body.get("choices") or [{}]
+    message = choices[0].get("message") or {}
+    content = message.get("content")
+    parsed = None
+    if output_type is not None and content:
+        parsed = output_type.model_validate_json(content)
+
+    return ChatMessage(content=content, parsed=parsed)
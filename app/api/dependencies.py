@@ -0,0 +1,16 @@
+from typing import AsyncIterator
+
+from app.services.fact_check_service import fact_check_slots
+
+
+async def fact_check_slot() -> AsyncIterator[None]:
+    """
+    Admission control for the single-claim fact-check endpoint.
+
+    Caps the number of fact-checks in progress per worker. Requests beyond
+    the limit wait for a free slot instead of all holding search results
+    and LLM calls in flight at once. Batch claims take their slots in the
+    batch service, one per claim.
+    """
+    async with fact_check_slots:
+        yield
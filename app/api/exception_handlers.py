@@ -1,15 +1,55 @@
-from fastapi import FastAPI, HTTPException, Request, status
-from fastapi.responses import JSONResponse
+from fastapi import FastAPI, Request, Response, status
 from fastapi.exceptions import RequestValidationError
 from pydantic import ValidationError
+from starlette.exceptions import HTTPException
 
 from app.schemas.response import ErrorResponse
-from app.api.transformers import ResponseTransformer
+from app.api.transformers import ResponseTransformer, dump_error
 from app.utils.logging import get_logger
 
 logger = get_logger(__name__)
 
 
+def log_error(response: ErrorResponse):
+    logger.error("Request error", error=response)
+
+
+def error_response(transformed: ErrorResponse) -> Response:
+    """
+    Log an error response and render it as JSON.
+
+    Args:
+        transformed: Standardized error response
+
+    Returns:
+        JSON error response
+    """
+    log_error(transformed)
+    return Response(
+        content=dump_error(transformed),
+        media_type="application/json",
+        status_code=transformed.status_code,
+    )
+
+
+def general_error_response(exc: Exception) -> Response:
+    """
+    Build the standard 500 response for an unhandled exception.
+
+    Args:
+        exc: Unhandled exception
+
+    Returns:
+        JSON error response
+    """
+    transformed = ResponseTransformer.error(
+        message=str(exc),
+        error_code="internal_server_error",
+        status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+    )
+    return error_response(transformed)
+
+
 def add_exception_handlers(app: FastAPI):
     """
     Add exception handlers to the FastAPI app.
@@ -18,9 +58,6 @@ def add_exception_handlers(app: FastAPI):
         app: FastAPI application
     """
 
-    def log_error(response: ErrorResponse):
-        logger.error("Request error", error=response)
-
     @app.exception_handler(RequestValidationError)
     async def validation_exception_handler(
         request: Request, exc: RequestValidationError
@@ -28,11 +65,7 @@ def add_exception_handlers(app: FastAPI):
         """Handle request validation errors."""
         errors = exc.errors()
         transformed = ResponseTransformer.validation_error(errors)
-        log_error(transformed)
-        return JSONResponse(
-            content=transformed.model_dump(exclude_none=True),
-            status_code=transformed.status_code,
-        )
+        return error_response(transformed)
 
     @app.exception_handler(ValidationError)
     async def pydantic_validation_exception_handler(
@@ -41,25 +74,12 @@ def add_exception_handlers(app: FastAPI):
         """Handle Pydantic validation errors."""
         errors = exc.errors()
         transformed = ResponseTransformer.validation_error(errors)
-        log_error(transformed)
-        return JSONResponse(
-            content=transformed.model_dump(exclude_none=True),
-            status_code=transformed.status_code,
-        )
+        return error_response(transformed)
 
     @app.exception_handler(Exception)
     async def general_exception_handler(request: Request, exc: Exception):
         """Handle general exceptions."""
-        transformed = ResponseTransformer.error(
-            message=str(exc),
-            error_code="internal_server_error",
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-        )
-        log_error(transformed)
-        return JSONResponse(
-            content=transformed.model_dump(exclude_none=True),
-            status_code=transformed.status_code,
-        )
+        return general_error_response(exc)
 
     @app.exception_handler(HTTPException)
     async def http_exception_handler(request: Request, exc: HTTPException):
@@ -69,8 +89,4 @@ def add_exception_handlers(app: FastAPI):
             error_code=str(exc.status_code),
             status_code=exc.status_code,
         )
-        log_error(transformed)
-        return JSONResponse(
-            content=transformed.model_dump(exclude_none=True, mode="json"),
-            status_code=transformed.status_code,
-        )
+        return error_response(transformed)
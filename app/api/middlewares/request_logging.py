@@ -1,59 +1,98 @@
-import uuid
+import itertools
+import secrets
 import time
-from fastapi import Request
+import uuid
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 from structlog.contextvars import clear_contextvars, bind_contextvars
-from starlette.middleware.base import BaseHTTPMiddleware
+from app.config.settings import settings
 from app.utils.logging import get_logger
 
 logger = get_logger(__name__)
 
+# Paths served without request logging (e.g. frequent health probes)
+UNLOGGED_PATHS = frozenset({"/health"})
+
+# Per-process random prefix plus a counter: unique within the process
+# without drawing from os.urandom on every request
+_REQUEST_ID_PREFIX = secrets.token_hex(4)
+_request_counter = itertools.count()
+
+
+def new_request_id() -> str:
+    """
+    Generate a request id.
+
+    Returns:
+        Process-unique id, or a uuid4 hex when globally unique ids are required
+    """
+    if settings.require_global_unique_request_id:
+        return uuid.uuid4().hex
+    return f"{_REQUEST_ID_PREFIX}{next(_request_counter):012x}"
+
 
-class RequestLoggingMiddleware(BaseHTTPMiddleware):
+class RequestLoggingMiddleware:
     """
     Middleware for logging API requests and responses.
 
     Logs request method, path, status code, and duration.
-    Adds a unique request ID to each request.
+    Adds a unique request ID to each request. Health checks are not logged.
+
+    Implemented as plain ASGI rather than BaseHTTPMiddleware, so requests
+    are not wrapped in an extra task and response stream per call.
     """
 
-    async def dispatch(self, request: Request, call_next):
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
         """
         Process and log request/response.
 
         Args:
-            request: Incoming request.
-            call_next: Next middleware in chain.
-
-        Returns:
-            Response from next middleware.
+            scope: ASGI connection scope.
+            receive: ASGI receive channel.
+            send: ASGI send channel.
         """
+        if scope["type"] != "http" or scope["path"] in UNLOGGED_PATHS:
+            await self.app(scope, receive, send)
+            return
+
         clear_contextvars()
-        request_id = str(uuid.uuid4())
-        request.state.request_id = request_id
-        start_time = time.time()
+        request_id = new_request_id()
+        scope.setdefault("state", {})["request_id"] = request_id
+        start_time = time.perf_counter()
 
+        client = scope.get("client")
         bind_contextvars(
             request_id=request_id,
-            method=request.method,
-            path=request.url.path,
-            client_ip=request.client.host if request.client else "unknown",
+            method=scope["method"],
+            path=scope["path"],
+            client_ip=client[0] if client else "unknown",
         )
 
         status_code = 500  # default to internal server error
+
+        async def send_with_request_id(message: Message):
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+                MutableHeaders(scope=message).append("X-Request-ID", request_id)
+            await send(message)
+
         try:
-            response = await call_next(request)
-            status_code = response.status_code
+            await self.app(scope, receive, send_with_request_id)
         except Exception as e:
             logger.error("Request error", error=str(e))
             raise
         finally:
-            duration_ms = (time.time() - start_time) * 1000
-            bind_contextvars(status_code=status_code, duration_ms=duration_ms)
+            duration_ms = (time.perf_counter() - start_time) * 1000
 
             if status_code < 400:
-                logger.info("Request success")
+                logger.info(
+                    "Request success", status_code=status_code, duration_ms=duration_ms
+                )
             else:
-                logger.error("Request failed", status_code=status_code)
-
-        response.headers["X-Request-ID"] = request_id
-        return response
+                logger.error(
+                    "Request failed", status_code=status_code, duration_ms=duration_ms
+                )
@@ -0,0 +1,72 @@
+import functools
+import inspect
+from typing import Any, Callable
+
+from fastapi import Request, Response, status
+from fastapi.exceptions import RequestValidationError
+from fastapi.routing import APIRoute
+from pydantic import ValidationError
+from starlette.concurrency import run_in_threadpool
+from starlette.exceptions import HTTPException
+
+from app.api.exception_handlers import general_error_response
+from app.api.transformers import ResponseTransformer, dump_success
+
+# Exceptions with dedicated handlers in app.api.exception_handlers
+HANDLED_EXCEPTIONS = (HTTPException, RequestValidationError, ValidationError)
+
+
+class StandardRoute(APIRoute):
+    """
+    APIRoute that wraps endpoint results in the StandardResponse format.
+
+    The endpoint's return value is wrapped and serialized once, instead of
+    having a middleware buffer, parse and re-serialize the response body.
+    Endpoints returning a Response are passed through as-is. Error
+    responses are produced by the exception handlers.
+    """
+
+    def __init__(self, path: str, endpoint: Callable[..., Any], **kwargs: Any):
+        # include_router() rebuilds routes from route.endpoint, which is
+        # already wrapped; wrap the original endpoint only once.
+        endpoint = getattr(endpoint, "__standard_endpoint__", endpoint)
+        status_code = kwargs.get("status_code") or status.HTTP_200_OK
+
+        @functools.wraps(endpoint)
+        async def standard_endpoint(*args: Any, **kwargs: Any) -> Response:
+            if inspect.iscoroutinefunction(endpoint):
+                result = await endpoint(*args, **kwargs)
+            else:
+                result = await run_in_threadpool(endpoint, *args, **kwargs)
+
+            # Responses built by the endpoint (streaming, files, non-JSON)
+            # are forwarded untouched instead of being buffered and wrapped.
+            if isinstance(result, Response):
+                return result
+
+            transformed = ResponseTransformer.success(
+                data=result, status_code=status_code
+            )
+            return Response(
+                content=dump_success(transformed),
+                media_type="application/json",
+                status_code=status_code,
+            )
+
+        standard_endpoint.__standard_endpoint__ = endpoint
+        super().__init__(path, standard_endpoint, **kwargs)
+
+    def get_route_handler(self) -> Callable[[Request], Any]:
+        route_handler = super().get_route_handler()
+
+        async def standard_route_handler(request: Request) -> Response:
+            try:
+                return await route_handler(request)
+            except HANDLED_EXCEPTIONS:
+                raise
+            except Exception as exc:  # noqa: BLE001 - last-resort 500 response
+                # Answer here rather than in ServerErrorMiddleware, which
+                # re-raises after responding.
+                return general_error_response(exc)
+
+        return standard_route_handler
@@ -1,15 +1,31 @@
-from fastapi import APIRouter
+from fastapi import APIRouter, Depends
 
-from app.models.request import FactCheckRequest
+from app.api.dependencies import fact_check_slot
+from app.api.route import StandardRoute
+from app.models.request import FactCheckBatchRequest, FactCheckRequest
 from app.models.response import ClaimReview
+from app.schemas.response import ClaimReviewListResponse, ClaimReviewResponse
+from app.services.batch_fact_check_service import batch_fact_check_service
 from app.services.fact_check_service import fact_check_service
 
-router = APIRouter()
+router = APIRouter(route_class=StandardRoute)
 
 
-@router.post("/fact-check", response_model=ClaimReview)
+@router.post(
+    "/fact-check",
+    response_model=ClaimReviewResponse,
+    dependencies=[Depends(fact_check_slot)],
+)
 async def fact_check(request: FactCheckRequest) -> ClaimReview:
     """
     Fact-check a claim and return structured verdict.
     """
     return await fact_check_service.fact_check(request=request)
+
+
+@router.post("/fact-check/batch", response_model=ClaimReviewListResponse)
+async def fact_check_batch(requests: FactCheckBatchRequest) -> list[ClaimReview]:
+    """
+    Fact-check several claims concurrently, preserving request order.
+    """
+    return await batch_fact_check_service.fact_check_batch(requests=requests)
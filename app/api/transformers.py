@@ -3,6 +3,15 @@ from fastapi import status
 
 from app.schemas.response import StandardResponse, ErrorResponse, ErrorDetail
 
+VALIDATION_ERROR_MESSAGE = "Validation error"
+
+# Shared main error for validation failures with the default message
+VALIDATION_ERROR_DETAIL = ErrorDetail(
+    code=None,
+    field=None,
+    message=VALIDATION_ERROR_MESSAGE,
+)
+
 
 class ResponseTransformer:
     """
@@ -39,7 +48,7 @@ class ResponseTransformer:
         error_code: str = "error",
         field: Optional[str] = None,
         status_code: int = status.HTTP_400_BAD_REQUEST,
-        errors: list[ErrorDetail] = None,
+        errors: Optional[tuple[ErrorDetail, ...]] = None,
         data: Optional[dict[str, Any]] = None,
     ) -> ErrorResponse:
         """
@@ -73,7 +82,7 @@ class ResponseTransformer:
     @staticmethod
     def validation_error(
         errors: list[dict[str, Any]],
-        message: str = "Validation error",
+        message: str = VALIDATION_ERROR_MESSAGE,
         status_code: int = status.HTTP_422_UNPROCESSABLE_ENTITY,
     ) -> ErrorResponse:
         """
@@ -101,16 +110,19 @@ class ResponseTransformer:
                 ErrorDetail(
                     field=str(field) if field is not None else None,
                     code=None,
-                    message=error.get("msg", "Validation error"),
+                    message=error.get("msg", VALIDATION_ERROR_MESSAGE),
                 )
             )
 
         # Use the first error as the main error
-        main_error = ErrorDetail(
-            code=None,
-            field=None,
-            message=message,
-        )
+        if message == VALIDATION_ERROR_MESSAGE:
+            main_error = VALIDATION_ERROR_DETAIL
+        else:
+            main_error = ErrorDetail(
+                code=None,
+                field=None,
+                message=message,
+            )
 
         return ErrorResponse(
             success=False,
@@ -118,3 +130,29 @@ class ResponseTransformer:
             errors=error_details,
             status_code=status_code,
         )
+
+
+def dump_success(response: StandardResponse) -> bytes:
+    """
+    Serialize a success response to JSON bytes.
+
+    Args:
+        response: Standardized success response
+
+    Returns:
+        JSON body with None fields omitted
+    """
+    return response.model_dump_json(by_alias=True, exclude_none=True).encode()
+
+
+def dump_error(response: ErrorResponse) -> bytes:
+    """
+    Serialize an error response to JSON bytes.
+
+    Args:
+        response: Standardized error response
+
+    Returns:
+        JSON body with None fields omitted
+    """
+    return response.model_dump_json(exclude_none=True).encode()
@@ -22,17 +22,30 @@ MODEL_MAPPING: dict[ModelUseCase, ModelConfig] = {
 }
 
 
+# Resolved once at import; model names never change at runtime
+MODEL_NAMES: dict[ModelUseCase, str] = {
+    use_case: config.model_name for use_case, config in MODEL_MAPPING.items()
+}
+WEBSEARCH_MODELS: dict[ModelUseCase, str] = {
+    use_case: f"{model_name}:online" for use_case, model_name in MODEL_NAMES.items()
+}
+
+
 class ModelSelector:
     """Select model based on use case."""
 
     @staticmethod
     def get_model_name(use_case: ModelUseCase) -> str:
         """Get model name for a use case."""
-        if use_case not in MODEL_MAPPING:
-            raise ValueError(f"Unknown use case: {use_case}")
-        return MODEL_MAPPING[use_case].model_name
+        try:
+            return MODEL_NAMES[use_case]
+        except KeyError:
+            raise ValueError(f"Unknown use case: {use_case}") from None
 
     @staticmethod
     def get_websearch_model(use_case: ModelUseCase) -> str:
         """Get model name with :online suffix for websearch."""
-        return f"{ModelSelector.get_model_name(use_case)}:online"
+        try:
+            return WEBSEARCH_MODELS[use_case]
+        except KeyError:
+            raise ValueError(f"Unknown use case: {use_case}") from None
@@ -1,4 +1,4 @@
-from pydantic_settings import BaseSettings
+from pydantic_settings import BaseSettings, SettingsConfigDict
 
 
 class Settings(BaseSettings):
@@ -12,12 +12,31 @@ class Settings(BaseSettings):
     openrouter_api_key: str = ""
     openrouter_api_url: str = "https://openrouter.ai/api/v1"
     max_search_results: int = 5
+    max_concurrent_fact_checks: int = 64
+    openrouter_max_concurrency: int = 32
+    openrouter_rpm: int = 600
+    openrouter_warmup_enabled: bool = True
+
+    # Response cache
+    response_cache_enabled: bool = True
+    response_cache_maxsize: int = 10_000
+    response_cache_ttl_seconds: int = 3600
+
+    # Semantic websearch cache (requires fastembed + hnswlib)
+    semantic_cache_enabled: bool = False
+    semantic_cache_model: str = "sentence-transformers/all-MiniLM-L6-v2"
+    semantic_cache_threshold: float = 0.95
+    semantic_cache_max_elements: int = 10_000
+    semantic_cache_path: str = ""
+
+    # CORS
+    cors_max_age_seconds: int = 86400
 
     # Logging
     log_level: str = "INFO"
+    require_global_unique_request_id: bool = False
 
-    class Config:
-        env_file = ".env"
+    model_config = SettingsConfigDict(env_file=".env")
 
 
 # Singleton instance
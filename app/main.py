@@ -1,13 +1,19 @@
-from fastapi import FastAPI
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Optional
+
+import orjson
+from fastapi import FastAPI, Response
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 from fastapi.openapi.docs import get_swagger_ui_html, get_redoc_html
 from fastapi.openapi.utils import get_openapi
 
 from app.utils.logging import configure_logging_for_api, get_logger
 from app.api.middlewares.request_logging import RequestLoggingMiddleware
-from app.api.middlewares.response import ResponseTransformerMiddleware
 from app.api.exception_handlers import add_exception_handlers
 from app.api.routes import router
+from app.adapters._client import close_http_client, warm_http_client
+from app.adapters.openrouter_websearch_adapter import semantic_search_cache
 from app.config.settings import settings
 
 # Configure logging before anything else
@@ -15,13 +21,47 @@ configure_logging_for_api()
 
 logger = get_logger(__name__)
 
+OPENAPI_URL = f"/v{settings.api_version}/openapi.json"
+OPENAPI_SECURITY_SCHEMES = {
+    "ApiKey": {
+        "type": "apiKey",
+        "in": "header",
+        "name": "X-API-Key",
+        "description": "API key for authentication",
+    }
+}
+OPENAPI_SECURITY = [{"ApiKey": []}]
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI) -> AsyncIterator[None]:
+    """
+    Application lifespan.
+
+    Startup serializes the OpenAPI schema and warms the OpenRouter
+    connection pool; shutdown persists caches and closes HTTP clients.
+    """
+    logger.info("Fact-Check API starting up")
+    openapi_json()
+    if settings.openrouter_warmup_enabled:
+        await warm_http_client()
+
+    yield
+
+    logger.info("Fact-Check API shutting down")
+    if semantic_search_cache is not None:
+        semantic_search_cache.save()
+    await close_http_client()
+
 app = FastAPI(
     title=settings.project_name,
     description="A 2-step LLM pipeline for fact-checking claims and generating ClaimReview JSON",
     version=f"v{settings.api_version}",
     docs_url=None,  # Disable default docs
     redoc_url=None,  # Disable default redoc
-    openapi_url=f"/v{settings.api_version}/openapi.json",
+    openapi_url=None,  # Served by the cached route below
+    default_response_class=ORJSONResponse,
+    lifespan=lifespan,
 )
 
 # Add CORS middleware
@@ -31,10 +71,10 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    max_age=settings.cors_max_age_seconds,  # Let browsers cache preflights
 )
 
 # Add custom middlewares (order matters - first added = last executed)
-app.add_middleware(ResponseTransformerMiddleware)
 app.add_middleware(RequestLoggingMiddleware)
 
 # Add exception handlers
@@ -49,7 +89,7 @@ app.include_router(router, prefix=f"/api/v{settings.api_version}")
 async def custom_swagger_ui_html():
     """Custom Swagger UI with persistent authorization."""
     return get_swagger_ui_html(
-        openapi_url=f"/v{settings.api_version}/openapi.json",
+        openapi_url=OPENAPI_URL,
         title=f"{settings.project_name} - Swagger UI",
         oauth2_redirect_url=None,
         swagger_js_url="https://cdn.jsdelivr.net/npm/swagger-ui-dist@5/swagger-ui-bundle.js",
@@ -63,16 +103,18 @@ async def custom_swagger_ui_html():
 async def redoc_html():
     """Custom ReDoc documentation."""
     return get_redoc_html(
-        openapi_url=f"/v{settings.api_version}/openapi.json",
+        openapi_url=OPENAPI_URL,
         title=f"{settings.project_name} - ReDoc",
         redoc_js_url="https://cdn.jsdelivr.net/npm/redoc@next/bundles/redoc.standalone.js",
     )
 
 
 # Custom OpenAPI schema
-@app.get(f"/v{settings.api_version}/openapi.json", include_in_schema=False)
-async def get_open_api_endpoint():
-    """Custom OpenAPI schema with security definitions."""
+def custom_openapi() -> dict[str, Any]:
+    """Build the OpenAPI schema with security definitions, once."""
+    if app.openapi_schema:
+        return app.openapi_schema
+
     openapi_schema = get_openapi(
         title=settings.project_name,
         version=f"v{settings.api_version}",
@@ -82,35 +124,36 @@ async def get_open_api_endpoint():
 
     # Add API key security scheme
     openapi_schema["components"] = openapi_schema.get("components", {})
-    openapi_schema["components"]["securitySchemes"] = {
-        "ApiKey": {
-            "type": "apiKey",
-            "in": "header",
-            "name": "X-API-Key",
-            "description": "API key for authentication",
-        }
-    }
+    openapi_schema["components"]["securitySchemes"] = OPENAPI_SECURITY_SCHEMES
 
     # Apply security requirement to all operations
     if "security" not in openapi_schema:
-        openapi_schema["security"] = [{"ApiKey": []}]
+        openapi_schema["security"] = OPENAPI_SECURITY
 
-    return openapi_schema
+    app.openapi_schema = openapi_schema
+    return app.openapi_schema
 
 
-@app.get("/health")
-async def health_check():
-    """Health check endpoint."""
-    return {"status": "healthy", "service": settings.project_name}
+app.openapi = custom_openapi
 
+_openapi_json: Optional[bytes] = None
 
-@app.on_event("startup")
-async def startup_event():
-    """Log startup message."""
-    logger.info("Fact-Check API starting up")
 
+def openapi_json() -> bytes:
+    """Get the OpenAPI schema as JSON bytes, serialized once."""
+    global _openapi_json
+    if _openapi_json is None:
+        _openapi_json = orjson.dumps(app.openapi())
+    return _openapi_json
 
-@app.on_event("shutdown")
-async def shutdown_event():
-    """Log shutdown message."""
-    logger.info("Fact-Check API shutting down")
+
+@app.get(OPENAPI_URL, include_in_schema=False)
+async def get_open_api_endpoint():
+    """Serve the cached OpenAPI schema."""
+    return Response(content=openapi_json(), media_type="application/json")
+
+
+@app.get("/health")
+async def health_check():
+    """Health check endpoint."""
+    return {"status": "healthy", "service": settings.project_name}
@@ -1,8 +1,10 @@
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 
 class PipelineParams(BaseModel):
     """Parameters for pipeline execution."""
 
+    model_config = ConfigDict(frozen=True)
+
     query: str = Field(..., description="Claim to fact-check")
     max_results: int = Field(default=5, ge=1, le=10)
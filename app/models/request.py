@@ -1,5 +1,9 @@
+from typing import Annotated
+
 from pydantic import BaseModel, Field
 
+MAX_BATCH_SIZE = 50
+
 
 class FactCheckRequest(BaseModel):
     """Request body for fact-check endpoint."""
@@ -11,3 +15,13 @@ class FactCheckRequest(BaseModel):
         description="The claim/statement to fact-check",
         examples=["The Great Wall of China is visible from space"],
     )
+
+
+FactCheckBatchRequest = Annotated[
+    list[FactCheckRequest],
+    Field(
+        min_length=1,
+        max_length=MAX_BATCH_SIZE,
+        description="Claims to fact-check in one call",
+    ),
+]
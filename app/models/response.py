@@ -1,14 +1,26 @@
-from pydantic import BaseModel, Field
-from typing import List
+from pydantic import BaseModel, ConfigDict, Field, field_validator
+
+__all__ = ["ClaimReview", "ItemReviewed", "Organization", "Rating"]
+
+# Response models are immutable; cached results are shared across requests
+RESPONSE_MODEL_CONFIG = ConfigDict(populate_by_name=True, frozen=True)
 
 
 class Organization(BaseModel):
     """Schema.org Organization."""
+
+    model_config = RESPONSE_MODEL_CONFIG
+
+    type: str = Field(default="Organization", alias="@type")
     name: str = Field(default="WordLift")
 
 
 class Rating(BaseModel):
     """Schema.org Rating."""
+
+    model_config = RESPONSE_MODEL_CONFIG
+
+    type: str = Field(default="Rating", alias="@type")
     ratingValue: str = Field(..., description="0-5 rating")
     alternateName: str = Field(..., description="Human-readable verdict")
     bestRating: str = Field(default="5")
@@ -17,11 +29,26 @@ class Rating(BaseModel):
 
 class ItemReviewed(BaseModel):
     """Schema.org CreativeWork for sources."""
-    url: List[str] = Field(..., description="Source URLs used")
+
+    model_config = RESPONSE_MODEL_CONFIG
+
+    type: str = Field(default="CreativeWork", alias="@type")
+    url: tuple[str, ...] = Field(..., description="Source URLs used")
+
+    @field_validator("url", mode="after")
+    @classmethod
+    def dedupe_urls(cls, value: tuple[str, ...]) -> tuple[str, ...]:
+        """Drop duplicate source URLs, keeping first-seen order."""
+        return tuple(dict.fromkeys(value))
 
 
 class ClaimReview(BaseModel):
     """Schema.org ClaimReview - the main output."""
+
+    model_config = RESPONSE_MODEL_CONFIG
+
+    context: str = Field(default="http://schema.org", alias="@context")
+    type: str = Field(default="ClaimReview", alias="@type")
     claimReviewed: str = Field(..., description="The exact claim checked")
     author: Organization = Field(default_factory=Organization)
     datePublished: str = Field(..., description="YYYY-MM-DD format")
@@ -29,6 +56,3 @@ class ClaimReview(BaseModel):
     url: str = Field(..., description="URL to the fact-check page")
     reviewBody: str = Field(..., description="Explanation of verdict")
     itemReviewed: ItemReviewed
-
-    class Config:
-        populate_by_name = True
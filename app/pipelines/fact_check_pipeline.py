@@ -1,6 +1,7 @@
 """Main pipeline orchestrator for fact-checking claims."""
 
-from datetime import datetime
+import functools
+from types import MappingProxyType
 
 from app.adapters.openrouter_adapter import openrouter_adapter
 from app.adapters.openrouter_websearch_adapter import (
@@ -11,10 +12,22 @@ from app.models.response import ClaimReview
 from app.models.internal import PipelineParams
 from app.config.model_config import ModelSelector, ModelUseCase
 from app.pipelines.prompts.evaluation import EVALUATION_PROMPT
+from app.utils.dates import today_iso
 from app.utils.logging import get_logger
 
 logger = get_logger(__name__)
 
+EVALUATION_MODEL = ModelSelector.get_model_name(ModelUseCase.FACT_CHECK_EVALUATION)
+
+# Default prompt templates, shared read-only by pipeline instances
+PROMPT_MAPPING = MappingProxyType({"evaluation": EVALUATION_PROMPT})
+
+
+@functools.lru_cache(maxsize=4)
+def _render_system_prompt(template: str, current_date: str) -> str:
+    """Format a system prompt template; the date changes at most daily."""
+    return template.format(current_date=current_date)
+
 
 class FactCheckPipeline:
     """
@@ -25,12 +38,14 @@ class FactCheckPipeline:
     - Step 2: LLM evaluation (structured output)
     """
 
+    __slots__ = ("openrouter_adapter", "websearch_adapter")
+
+    # Shared by all instances; override on the class (or a subclass)
+    prompt_mapping = PROMPT_MAPPING
+
     def __init__(self):
         self.openrouter_adapter = openrouter_adapter
         self.websearch_adapter = openrouter_websearch_adapter
-        self.prompt_mapping = {
-            "evaluation": EVALUATION_PROMPT,
-        }
 
     async def execute(self, *, params: PipelineParams) -> ClaimReview:
         """
@@ -85,7 +100,7 @@ class FactCheckPipeline:
         search_results: list[WebsearchResponse],
     ) -> ClaimReview:
         """Step 2: Evaluate claim using LLM with structured output."""
-        current_date = datetime.now().strftime("%Y-%m-%d")
+        current_date = today_iso()
 
         # Build user message
         user_prompt = self._build_user_prompt(
@@ -95,8 +110,8 @@ class FactCheckPipeline:
         )
 
         # Build messages array
-        system_prompt = self.prompt_mapping["evaluation"].format(
-            current_date=current_date
+        system_prompt = _render_system_prompt(
+            self.prompt_mapping["evaluation"], current_date
         )
         messages = [
             {"role": "system", "content": system_prompt},
@@ -105,7 +120,7 @@ class FactCheckPipeline:
 
         # Call LLM with structured output
         result = await self.openrouter_adapter.make_request(
-            model=ModelSelector.get_model_name(ModelUseCase.FACT_CHECK_EVALUATION),
+            model=EVALUATION_MODEL,
             messages=messages,
             output_type=ClaimReview,
         )
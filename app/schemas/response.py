@@ -1,13 +1,20 @@
 from typing import Generic, TypeVar, Optional, Any
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict
 from fastapi import status
 
+from app.models.response import ClaimReview
+
 T = TypeVar("T")
 
+# Envelopes are built once per response and never mutated
+SCHEMA_CONFIG = ConfigDict(frozen=True, extra="forbid")
+
 
 class StandardResponse(BaseModel, Generic[T]):
     """Standard response model for successful API responses."""
 
+    model_config = SCHEMA_CONFIG
+
     success: bool = True
     data: Optional[T] = None
     message: Optional[str] = None
@@ -17,6 +24,8 @@ class StandardResponse(BaseModel, Generic[T]):
 class ErrorDetail(BaseModel):
     """Model for detailed error information."""
 
+    model_config = SCHEMA_CONFIG
+
     field: Optional[str] = None
     code: Optional[str] = "error"
     message: str
@@ -25,8 +34,15 @@ class ErrorDetail(BaseModel):
 class ErrorResponse(BaseModel):
     """Standard error response model."""
 
+    model_config = SCHEMA_CONFIG
+
     success: bool = False
     error: Optional[ErrorDetail] = None
-    errors: Optional[list[ErrorDetail]] = []
+    errors: Optional[tuple[ErrorDetail, ...]] = ()
     status_code: int = status.HTTP_400_BAD_REQUEST
     data: Optional[dict[str, Any]] = None
+
+
+# Concrete envelopes, parametrized once at import for route response models
+ClaimReviewResponse = StandardResponse[ClaimReview]
+ClaimReviewListResponse = StandardResponse[list[ClaimReview]]
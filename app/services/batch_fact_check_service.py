@@ -0,0 +1,71 @@
+import asyncio
+from typing import Optional
+
+from app.models.request import FactCheckRequest
+from app.models.response import ClaimReview
+from app.services.fact_check_service import (
+    FactCheckService,
+    fact_check_service,
+    fact_check_slots,
+)
+from app.utils.logging import get_logger
+
+logger = get_logger(__name__)
+
+
+class BatchFactCheckService:
+    """
+    Service for fact-checking several claims in one request.
+
+    Claims run concurrently through the single-claim service, so wall-clock
+    time is close to the slowest claim rather than the sum. Outbound
+    OpenRouter calls stay bounded by the shared concurrency and rate limits,
+    and each claim takes its own admission slot, so a batch counts against
+    the per-worker fact-check limit like that many single requests.
+    If one claim fails, the others are cancelled rather than left spending
+    LLM calls on a request that has already failed.
+    """
+
+    __slots__ = ("service", "slots")
+
+    def __init__(
+        self,
+        service: Optional[FactCheckService] = None,
+        slots: Optional[asyncio.Semaphore] = None,
+    ):
+        self.service = service or fact_check_service
+        self.slots = slots or fact_check_slots
+
+    async def fact_check_batch(
+        self, *, requests: list[FactCheckRequest]
+    ) -> list[ClaimReview]:
+        """
+        Execute fact-checks for a batch of requests.
+
+        Args:
+            requests: FactCheckRequests from API
+
+        Returns:
+            list[ClaimReview]: Results in the same order as the requests
+        """
+        logger.info("Processing fact-check batch", size=len(requests))
+        tasks = [
+            asyncio.create_task(self._fact_check_one(request))
+            for request in requests
+        ]
+        try:
+            return await asyncio.gather(*tasks)
+        except BaseException:
+            # gather leaves siblings running when one task fails
+            for task in tasks:
+                task.cancel()
+            raise
+
+    async def _fact_check_one(self, request: FactCheckRequest) -> ClaimReview:
+        """Fact-check one claim while holding an admission slot."""
+        async with self.slots:
+            return await self.service.fact_check(request=request)
+
+
+# Default service instance
+batch_fact_check_service = BatchFactCheckService()
@@ -1,3 +1,6 @@
+import asyncio
+
+from app.config.settings import settings
 from app.models.request import FactCheckRequest
 from app.models.response import ClaimReview
 from app.models.internal import PipelineParams
@@ -6,6 +9,10 @@ from app.utils.logging import get_logger
 
 logger = get_logger(__name__)
 
+# Fact-checks allowed in progress per worker, shared by the single-claim
+# endpoint and every claim of a batch
+fact_check_slots = asyncio.Semaphore(settings.max_concurrent_fact_checks)
+
 
 class FactCheckService:
     """
@@ -17,6 +24,8 @@ class FactCheckService:
     - Dependency injection point
     """
 
+    __slots__ = ("pipeline",)
+
     def __init__(self, pipeline=None):
         self.pipeline = pipeline or fact_check_pipeline
 
@@ -0,0 +1,89 @@
+import asyncio
+import contextvars
+import functools
+import hashlib
+from typing import Any, Awaitable, Callable, Hashable, TypeVar
+
+import orjson
+from cachetools import TTLCache
+
+T = TypeVar("T")
+
+_MISSING = object()
+
+
+def make_cache_key(*parts: Any) -> bytes:
+    """
+    Build a stable cache key from JSON-serializable parts.
+
+    Args:
+        parts: Values identifying the cached call
+
+    Returns:
+        blake2b digest of the serialized parts
+    """
+    return hashlib.blake2b(orjson.dumps(parts)).digest()
+
+
+class AsyncTTLCache:
+    """
+    In-memory TTL/LRU cache for coroutine results.
+
+    Concurrent misses on the same key are coalesced into a single
+    upstream call (single-flight) that keeps running if the caller that
+    started it is cancelled. Failed calls are never cached.
+    """
+
+    def __init__(self, *, maxsize: int, ttl: float):
+        self._cache: TTLCache = TTLCache(maxsize=maxsize, ttl=ttl)
+        self._in_flight: dict[Hashable, asyncio.Future] = {}
+
+    def __len__(self) -> int:
+        return len(self._cache)
+
+    def clear(self):
+        """Drop all cached entries."""
+        self._cache.clear()
+
+    async def get_or_set(
+        self, key: Hashable, factory: Callable[[], Awaitable[T]]
+    ) -> T:
+        """
+        Return the cached value for key, computing it with factory on a miss.
+
+        Args:
+            key: Cache key
+            factory: Zero-argument coroutine function producing the value
+
+        Returns:
+            Cached or freshly computed value
+        """
+        # No awaits between lookup and registration, so this section is
+        # atomic with respect to the event loop and needs no lock.
+        value = self._cache.get(key, _MISSING)
+        if value is not _MISSING:
+            return value
+
+        task = self._in_flight.get(key)
+        if task is None:
+            # The factory runs in its own task so that cancelling the
+            # caller that started it does not cancel the callers sharing it,
+            # and in an empty context so shared work (and its log lines)
+            # carries no single caller's request_id.
+            task = asyncio.get_running_loop().create_task(
+                factory(), context=contextvars.Context()
+            )
+            self._in_flight[key] = task
+            task.add_done_callback(functools.partial(self._finish, key))
+
+        return await asyncio.shield(task)
+
+    def _finish(self, key: Hashable, task: asyncio.Future):
+        """Cache a successful result and release the in-flight slot."""
+        self._in_flight.pop(key, None)
+        if task.cancelled():
+            return
+        # Retrieving the exception also stops an unobserved failure
+        # from being logged when every caller has gone away.
+        if task.exception() is None:
+            self._cache[key] = task.result()
@@ -0,0 +1,23 @@
+import time
+from datetime import date, datetime, timedelta
+
+# (ISO date, timestamp of the next local midnight)
+_today: tuple[str, float] = ("", 0.0)
+
+
+def today_iso() -> str:
+    """
+    Get today's local date as YYYY-MM-DD.
+
+    The string is cached until the next local midnight, so most calls
+    are a single clock read and comparison.
+
+    Returns:
+        Today's date in ISO format
+    """
+    global _today
+    if time.time() >= _today[1]:
+        today = date.today()
+        midnight = datetime.combine(today + timedelta(days=1), datetime.min.time())
+        _today = (today.isoformat(), midnight.timestamp())
+    return _today[0]
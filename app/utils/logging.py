@@ -1,3 +1,4 @@
+import functools
 import sys
 from typing import Any, List, Optional
 from logging import basicConfig, DEBUG, getLogger
@@ -45,7 +46,7 @@ def configure_logger(shared_processors: List):
         context_class=dict,
         wrapper_class=make_filtering_bound_logger(DEBUG),
         logger_factory=stdlib.LoggerFactory(),
-        cache_logger_on_first_use=False,
+        cache_logger_on_first_use=True,
     )
 
 
@@ -63,6 +64,7 @@ def configure_logging_for_api():
     configure_logger(shared_processors)
 
 
+@functools.lru_cache(maxsize=None)
 def get_logger(ctx: Optional[str] = None) -> Any:
     """
     Get the API logger with the specified context.
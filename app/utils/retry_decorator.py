@@ -18,6 +18,9 @@ def retry_with_exponential_backoff_async(
     """
     Decorator for retrying an async function with exponential backoff.
 
+    If the raised exception has a ``retry_after`` attribute (seconds), that
+    delay is used for the next attempt instead of the computed backoff.
+
     Args:
         max_retries: Maximum number of retry attempts
         base_delay: Initial delay in seconds before first retry
@@ -29,6 +32,9 @@ def retry_with_exponential_backoff_async(
         Decorated function with retry logic
     """
 
+    # Backoff delay before each retry, fixed for the decorated function
+    delays = tuple(min(max_delay, base_delay * (1 << i)) for i in range(max_retries))
+
     def decorator(func):
         @functools.wraps(func)
         async def wrapper(*args, **kwargs):
@@ -45,10 +51,14 @@ def retry_with_exponential_backoff_async(
                         )
                         raise
 
-                    # Calculate backoff delay with jitter
-                    delay = min(max_delay, base_delay * (2 ** (retries - 1)))
-                    jitter = random.uniform(0, jitter_factor * delay)
-                    wait_time = delay + jitter
+                    # Honour a server-provided Retry-After (e.g. on 429),
+                    # otherwise calculate backoff delay with jitter
+                    retry_after = getattr(e, "retry_after", None)
+                    if retry_after is not None:
+                        wait_time = min(max_delay, retry_after)
+                    else:
+                        delay = delays[retries - 1]
+                        wait_time = delay + random.random() * jitter_factor * delay
 
                     logger.warning(
                         f"Error in {func.__name__} (attempt {retries}/{max_retries}): {str(e)}. "
@@ -0,0 +1,246 @@
+import asyncio
+import os
+import tempfile
+import time
+from typing import Any, Awaitable, Callable, Generic, Optional, TypeVar
+
+import orjson
+from pydantic import TypeAdapter
+
+from app.config.settings import settings
+from app.utils.logging import get_logger
+
+logger = get_logger(__name__)
+
+T = TypeVar("T")
+
+# Neighbours inspected per lookup, so a closer entry from another scope
+# does not hide a same-scope match
+SEARCH_K = 8
+
+# Byte length of the metadata-size header in the persisted cache file
+_HEADER_SIZE = 8
+
+
+class SemanticCache(Generic[T]):
+    """
+    Nearest-neighbour cache keyed on query embeddings.
+
+    Queries are embedded with a small local model (fastembed, ONNX on CPU)
+    and stored in an hnswlib cosine index. A lookup returns the value of
+    the closest stored query in the same scope when its similarity exceeds
+    the threshold, so rewordings of the same claim share one cached result.
+    Entries expire after ttl seconds, including across restarts.
+
+    Requires the optional ``fastembed`` and ``hnswlib`` packages.
+    """
+
+    def __init__(
+        self,
+        *,
+        value_type: Any,
+        model_name: str,
+        threshold: float,
+        max_elements: int,
+        ttl: float,
+        path: Optional[str] = None,
+    ):
+        import hnswlib  # noqa: F401 - fail fast when the extra is missing
+
+        self._adapter = TypeAdapter(value_type)
+        self._model_name = model_name
+        self._threshold = threshold
+        self._max_elements = max_elements
+        self._ttl = ttl
+        self._file = f"{path}.cache" if path else None
+        self._embedder = None
+        self._index = None
+        self._entries: dict[int, dict[str, Any]] = {}
+        self._next_label = 0
+
+        if self._file and os.path.exists(self._file):
+            self._load()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    async def get_or_set(
+        self, query: str, factory: Callable[[], Awaitable[T]], *, scope: str
+    ) -> T:
+        """
+        Return the value for the most similar query, computing it on a miss.
+
+        The query is embedded once and the same vector is used to store
+        the freshly computed value.
+
+        Args:
+            query: Query text
+            factory: Zero-argument coroutine function producing the value
+            scope: Partition key; only entries with the same scope match
+
+        Returns:
+            Cached or freshly computed value
+        """
+        vector = await asyncio.to_thread(self._embed, query)
+
+        cached = self._lookup(vector, scope=scope)
+        if cached is not None:
+            return cached
+
+        value = await factory()
+        self._add(vector, value, scope=scope)
+        return value
+
+    def save(self):
+        """
+        Persist the index and unexpired cached values to disk.
+
+        Metadata and index go into a single file that is swapped in with
+        os.replace, so workers saving to the same path concurrently leave
+        one complete snapshot rather than one worker's index paired with
+        another's entries.
+        """
+        if not self._file or self._index is None:
+            return
+
+        self._expire_all()
+        meta = orjson.dumps(
+            {"dim": self._index.dim, "entries": list(self._entries.values())}
+        )
+        directory = os.path.dirname(os.path.abspath(self._file))
+        with tempfile.TemporaryDirectory(dir=directory) as tmp:
+            index_path = os.path.join(tmp, "index")
+            self._index.save_index(index_path)
+            with open(index_path, "rb") as f:
+                index = f.read()
+
+            snapshot = os.path.join(tmp, "cache")
+            with open(snapshot, "wb") as f:
+                f.write(len(meta).to_bytes(_HEADER_SIZE, "big"))
+                f.write(meta)
+                f.write(index)
+            os.replace(snapshot, self._file)
+        logger.info("Semantic cache saved", entries=len(self._entries))
+
+    def _lookup(self, vector, *, scope: str) -> Optional[T]:
+        if self._index is None or not self._entries:
+            return None
+
+        k = min(SEARCH_K, len(self._entries))
+        labels, distances = self._index.knn_query(vector, k=k)
+        now = time.time()
+
+        for label, distance in zip(labels[0], distances[0], strict=True):
+            similarity = 1.0 - float(distance)
+            if similarity < self._threshold:
+                break
+
+            label = int(label)
+            entry = self._entries[label]
+            if entry["expires_at"] <= now:
+                self._delete(label)
+                continue
+            if entry["scope"] != scope:
+                continue
+
+            logger.info("Semantic cache hit", similarity=round(similarity, 4))
+            return self._adapter.validate_python(entry["value"])
+
+        return None
+
+    def _add(self, vector, value: T, *, scope: str):
+        if len(self._entries) >= self._max_elements:
+            self._expire_all()
+            if len(self._entries) >= self._max_elements:
+                return
+
+        if self._index is None:
+            self._init_index(dim=len(vector))
+
+        label = self._next_label
+        self._next_label += 1
+        self._entries[label] = {
+            "label": label,
+            "scope": scope,
+            "expires_at": time.time() + self._ttl,
+            "value": self._adapter.dump_python(value, mode="json"),
+        }
+        self._index.add_items([vector], [label], replace_deleted=True)
+
+    def _delete(self, label: int):
+        self._index.mark_deleted(label)
+        del self._entries[label]
+
+    def _expire_all(self):
+        now = time.time()
+        expired = [
+            label
+            for label, entry in self._entries.items()
+            if entry["expires_at"] <= now
+        ]
+        for label in expired:
+            self._delete(label)
+
+    def _load(self):
+        with open(self._file, "rb") as f:
+            data = f.read()
+
+        meta_end = _HEADER_SIZE + int.from_bytes(data[:_HEADER_SIZE], "big")
+        meta = orjson.loads(data[_HEADER_SIZE:meta_end])
+
+        import hnswlib
+
+        self._index = hnswlib.Index(space="cosine", dim=meta["dim"])
+        with tempfile.TemporaryDirectory() as tmp:
+            index_path = os.path.join(tmp, "index")
+            with open(index_path, "wb") as f:
+                f.write(data[meta_end:])
+            self._index.load_index(
+                index_path,
+                max_elements=self._max_elements,
+                allow_replace_deleted=True,
+            )
+        self._entries = {entry["label"]: entry for entry in meta["entries"]}
+        self._next_label = max(self._entries, default=-1) + 1
+        self._expire_all()
+        logger.info("Semantic cache loaded", entries=len(self._entries))
+
+    def _init_index(self, *, dim: int):
+        import hnswlib
+
+        self._index = hnswlib.Index(space="cosine", dim=dim)
+        self._index.init_index(
+            max_elements=self._max_elements, allow_replace_deleted=True
+        )
+
+    def _embed(self, text: str):
+        if self._embedder is None:
+            from fastembed import TextEmbedding
+
+            self._embedder = TextEmbedding(model_name=self._model_name)
+        return next(iter(self._embedder.embed([text])))
+
+
+def create_semantic_cache(value_type: Any) -> Optional[SemanticCache]:
+    """
+    Build a SemanticCache from settings, or None when disabled.
+
+    Entries share the exact response cache's TTL.
+
+    Args:
+        value_type: Type of the cached values
+
+    Returns:
+        SemanticCache instance or None
+    """
+    if not settings.semantic_cache_enabled:
+        return None
+
+    return SemanticCache(
+        value_type=value_type,
+        model_name=settings.semantic_cache_model,
+        threshold=settings.semantic_cache_threshold,
+        max_elements=settings.semantic_cache_max_elements,
+        ttl=settings.response_cache_ttl_seconds,
+        path=settings.semantic_cache_path,
+    )
@@ -1,11 +1,16 @@
 """Shared test fixtures and configuration."""
 
 import os
+from types import SimpleNamespace
+
 import pytest
-from unittest.mock import AsyncMock
+import pytest_asyncio
+
+from tests.helpers import RecordingAsyncMock
 
 # Set test environment variables before importing app modules
 os.environ["OPENROUTER_API_KEY"] = "test-key-for-testing"
+os.environ["OPENROUTER_WARMUP_ENABLED"] = "false"
 
 
 @pytest.fixture
@@ -14,7 +19,41 @@ def anyio_backend():
     return "asyncio"
 
 
-@pytest.fixture
+@pytest_asyncio.fixture(scope="session", loop_scope="session")
+async def client():
+    """
+    Single ASGI client shared by all integration tests.
+
+    The app's lifespan runs once for the whole session; ASGITransport does
+    not drive lifespan events itself.
+    """
+    from httpx import ASGITransport, AsyncClient
+    from app.main import app
+
+    async with (
+        app.router.lifespan_context(app),
+        AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as c,
+    ):
+        yield c
+
+
+# Mocks shared across the session; recorded calls are reset per test.
+SHARED_MOCKS = {
+    "mock_websearch_adapter": "search",
+    "mock_openrouter_adapter": "make_request",
+    "mock_pipeline": "execute",
+}
+
+
+@pytest.fixture(autouse=True)
+def reset_shared_mocks(request):
+    """Clear call history on the session-scoped mocks a test uses."""
+    for name, attr in SHARED_MOCKS.items():
+        if name in request.fixturenames:
+            getattr(request.getfixturevalue(name), attr).reset_mock()
+
+
+@pytest.fixture(scope="session")
 def mock_websearch_response():
     """Mock websearch results."""
     from app.adapters.openrouter_websearch_adapter import WebsearchResponse
@@ -33,7 +72,7 @@ def mock_websearch_response():
     ]
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def mock_claim_review():
     """Reusable mock ClaimReview for tests."""
     from app.models.response import ClaimReview, Rating, ItemReviewed
@@ -48,25 +87,19 @@ def mock_claim_review():
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def mock_websearch_adapter(mock_websearch_response):
     """Mock OpenRouterWebsearchAdapter."""
-    adapter = AsyncMock()
-    adapter.search.return_value = mock_websearch_response
-    return adapter
+    return SimpleNamespace(search=RecordingAsyncMock(mock_websearch_response))
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def mock_openrouter_adapter(mock_claim_review):
     """Mock OpenRouterAdapter."""
-    adapter = AsyncMock()
-    adapter.make_request.return_value = mock_claim_review
-    return adapter
+    return SimpleNamespace(make_request=RecordingAsyncMock(mock_claim_review))
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def mock_pipeline(mock_claim_review):
     """Mock FactCheckPipeline."""
-    pipeline = AsyncMock()
-    pipeline.execute.return_value = mock_claim_review
-    return pipeline
+    return SimpleNamespace(execute=RecordingAsyncMock(mock_claim_review))
@@ -0,0 +1,58 @@
+"""Test helpers shared across test modules."""
+
+import functools
+from unittest.mock import call
+
+
+class RecordingAsyncMock:
+    """
+    Minimal async callable that records calls and returns a fixed value.
+
+    A lightweight stand-in for AsyncMock exposing the parts tests use:
+    return_value, side_effect, call_args, call_count and assertions.
+    """
+
+    def __init__(self, return_value=None, side_effect=None):
+        self.return_value = return_value
+        self.side_effect = side_effect
+        self.call_args_list = []
+
+    async def __call__(self, *args, **kwargs):
+        self.call_args_list.append(call(*args, **kwargs))
+        if self.side_effect is not None:
+            return self.side_effect(*args, **kwargs)
+        return self.return_value
+
+    def reset_mock(self):
+        """Forget recorded calls, keeping return_value and side_effect."""
+        self.call_args_list.clear()
+
+    @property
+    def call_count(self):
+        return len(self.call_args_list)
+
+    @property
+    def call_args(self):
+        return self.call_args_list[-1] if self.call_args_list else None
+
+    def assert_called_once(self):
+        assert self.call_count == 1, f"Expected 1 call, got {self.call_count}"
+
+    def assert_called_once_with(self, *args, **kwargs):
+        self.assert_called_once()
+        assert self.call_args == call(*args, **kwargs), (
+            f"Expected {call(*args, **kwargs)}, got {self.call_args}"
+        )
+
+
+@functools.lru_cache(maxsize=None)
+def pipeline_params(query: str = "Test", max_results: int = 5):
+    """
+    Shared PipelineParams for a given query and result count.
+
+    PipelineParams is frozen, so identical arguments can safely reuse one
+    validated instance instead of revalidating per test.
+    """
+    from app.models.internal import PipelineParams
+
+    return PipelineParams(query=query, max_results=max_results)
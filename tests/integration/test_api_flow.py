@@ -1,231 +1,230 @@
 """Integration tests for the full API flow."""
 
+import orjson
 import pytest
 import respx
-from httpx import Response, ASGITransport, AsyncClient
-import json
-
-from app.main import app
-
-
-# Mock responses for OpenRouter API
-WEBSEARCH_RESPONSE = {
-    "id": "chatcmpl-websearch-123",
-    "object": "chat.completion",
-    "choices": [
-        {
-            "index": 0,
-            "finish_reason": "stop",
-            "message": {
-                "role": "assistant",
-                "content": json.dumps(
-                    {
-                        "results": [
-                            {
-                                "title": "NASA: The Sky Appears Blue",
-                                "url": "https://nasa.gov/sky-blue",
-                                "content": "The sky appears blue due to Rayleigh scattering of sunlight by the atmosphere.",
-                            },
-                            {
-                                "title": "Scientific American: Why Blue?",
-                                "url": "https://scientificamerican.com/blue-sky",
-                                "content": "Blue light has a shorter wavelength and is scattered more than other colors.",
-                            },
-                        ]
-                    }
-                ),
-            },
-        }
-    ],
+from httpx import Response
+
+from app.adapters.openrouter_adapter import OpenRouterAdapter, _response_cache
+from app.adapters.openrouter_websearch_adapter import (
+    OpenRouterWebsearchAdapter,
+    WebsearchResponse,
+    _search_cache,
+)
+from app.models.response import ClaimReview
+from tests.helpers import RecordingAsyncMock
+
+
+CLAIM_DICT = {
+    "@context": "http://schema.org",
+    "@type": "ClaimReview",
+    "claimReviewed": "The sky is blue",
+    "author": {"@type": "Organization", "name": "WordLift"},
+    "datePublished": "2025-01-01",
+    "reviewRating": {
+        "@type": "Rating",
+        "ratingValue": "5",
+        "alternateName": "True",
+        "bestRating": "5",
+        "worstRating": "1",
+    },
+    "url": "https://fact-check.wordlift.io/review/sky-is-blue",
+    "reviewBody": "This claim is verified as true. NASA confirms that the sky appears blue due to Rayleigh scattering.",
+    "itemReviewed": {
+        "@type": "CreativeWork",
+        "url": ["https://nasa.gov/sky-blue"],
+    },
 }
 
-EVALUATION_RESPONSE = {
-    "id": "chatcmpl-eval-456",
-    "object": "chat.completion",
-    "choices": [
-        {
-            "index": 0,
-            "finish_reason": "stop",
-            "message": {
-                "role": "assistant",
-                "content": json.dumps(
-                    {
-                        "@context": "http://schema.org",
-                        "@type": "ClaimReview",
-                        "claimReviewed": "The sky is blue",
-                        "author": {"@type": "Organization", "name": "WordLift"},
-                        "datePublished": "2025-01-01",
-                        "reviewRating": {
-                            "@type": "Rating",
-                            "ratingValue": "5",
-                            "alternateName": "True",
-                            "bestRating": "5",
-                            "worstRating": "1",
-                        },
-                        "url": "https://fact-check.wordlift.io/review/sky-is-blue",
-                        "reviewBody": "This claim is verified as true. NASA confirms that the sky appears blue due to Rayleigh scattering.",
-                        "itemReviewed": {
-                            "@type": "CreativeWork",
-                            "url": ["https://nasa.gov/sky-blue"],
-                        },
-                    }
-                ),
-                "parsed": {
-                    "@context": "http://schema.org",
-                    "@type": "ClaimReview",
-                    "claimReviewed": "The sky is blue",
-                    "author": {"@type": "Organization", "name": "WordLift"},
-                    "datePublished": "2025-01-01",
-                    "reviewRating": {
-                        "@type": "Rating",
-                        "ratingValue": "5",
-                        "alternateName": "True",
-                        "bestRating": "5",
-                        "worstRating": "1",
-                    },
-                    "url": "https://fact-check.wordlift.io/review/sky-is-blue",
-                    "reviewBody": "This claim is verified as true. NASA confirms that the sky appears blue due to Rayleigh scattering.",
-                    "itemReviewed": {
-                        "@type": "CreativeWork",
-                        "url": ["https://nasa.gov/sky-blue"],
-                    },
-                },
-            },
-        }
-    ],
-}
+# Canned adapter results, validated once at import
+SEARCH_RESULTS = [
+    WebsearchResponse(
+        title="NASA: The Sky Appears Blue",
+        url="https://nasa.gov/sky-blue",
+        content="The sky appears blue due to Rayleigh scattering of sunlight by the atmosphere.",
+    ),
+    WebsearchResponse(
+        title="Scientific American: Why Blue?",
+        url="https://scientificamerican.com/blue-sky",
+        content="Blue light has a shorter wavelength and is scattered more than other colors.",
+    ),
+]
+CLAIM_REVIEW = ClaimReview.model_validate(CLAIM_DICT)
+
+
+def completion_bytes(content: dict) -> bytes:
+    """Serialize a chat completion whose message content is the given JSON."""
+    message = {"role": "assistant", "content": orjson.dumps(content).decode()}
+    return orjson.dumps({"choices": [{"index": 0, "message": message}]})
+
+
+# Raw OpenRouter responses, serialized once for the respx-backed flow
+WEBSEARCH_BYTES = completion_bytes(
+    {"results": [result.model_dump() for result in SEARCH_RESULTS]}
+)
+EVALUATION_BYTES = completion_bytes(CLAIM_DICT)
+JSON_HEADERS = {"content-type": "application/json"}
+
+LONG_QUERY = "x" * 1001
+
+# One OpenRouter mock router, built once and reused by the integration tests
+OPENROUTER = respx.mock(base_url="https://openrouter.ai/api/v1", assert_all_called=False)
+OPENROUTER.post("/chat/completions", name="completions")
+
+
+@pytest.fixture(autouse=True)
+def clear_response_caches():
+    """Start each test with empty adapter caches so mocks are always hit."""
+    _response_cache.clear()
+    _search_cache.clear()
 
 
 class TestHealthEndpoint:
     """Tests for the health endpoint."""
 
-    @pytest.mark.asyncio
-    async def test_health_returns_200(self):
+    async def test_health_returns_200(self, client):
         """Test health endpoint returns 200."""
-        async with AsyncClient(
-            transport=ASGITransport(app=app), base_url="http://test"
-        ) as client:
-            response = await client.get("/health")
+        response = await client.get("/health")
 
-            assert response.status_code == 200
-            assert response.json()["status"] == "healthy"
+        assert response.status_code == 200
+        assert orjson.loads(response.content)["status"] == "healthy"
 
 
-class TestFactCheckEndpointValidation:
-    """Tests for fact-check endpoint validation."""
+class TestOpenAPIEndpoint:
+    """Tests for the OpenAPI schema endpoint."""
 
-    @pytest.mark.asyncio
-    async def test_empty_query_returns_422(self):
-        """Test that empty query returns validation error."""
-        async with AsyncClient(
-            transport=ASGITransport(app=app), base_url="http://test"
-        ) as client:
-            response = await client.post("/api/v1/fact-check", json={"query": ""})
+    async def test_openapi_includes_security_scheme(self, client):
+        """Test that the served schema includes the API key security scheme."""
+        response = await client.get("/v1/openapi.json")
 
-            assert response.status_code == 422
+        assert response.status_code == 200
+        data = orjson.loads(response.content)
+        assert "ApiKey" in data["components"]["securitySchemes"]
+        assert data["security"] == [{"ApiKey": []}]
 
-    @pytest.mark.asyncio
-    async def test_missing_query_returns_422(self):
-        """Test that missing query returns validation error."""
-        async with AsyncClient(
-            transport=ASGITransport(app=app), base_url="http://test"
-        ) as client:
-            response = await client.post("/api/v1/fact-check", json={})
 
-            assert response.status_code == 422
+class TestFactCheckEndpointValidation:
+    """Tests for fact-check endpoint validation."""
 
-    @pytest.mark.asyncio
-    async def test_query_too_long_returns_422(self):
-        """Test that query exceeding max length returns validation error."""
-        async with AsyncClient(
-            transport=ASGITransport(app=app), base_url="http://test"
-        ) as client:
-            response = await client.post("/api/v1/fact-check", json={"query": "x" * 1001})
+    @pytest.mark.parametrize(
+        "path, payload",
+        [
+            ("/api/v1/fact-check", {"query": ""}),
+            ("/api/v1/fact-check", {}),
+            ("/api/v1/fact-check", {"query": LONG_QUERY}),
+            ("/api/v1/fact-check/batch", []),
+        ],
+        ids=["empty_query", "missing_query", "query_too_long", "empty_batch"],
+    )
+    async def test_invalid_payload_returns_422(self, client, path, payload):
+        """Test that invalid request bodies return validation error."""
+        response = await client.post(path, json=payload)
 
-            assert response.status_code == 422
+        assert response.status_code == 422
 
 
 class TestFactCheckEndpointIntegration:
     """Integration tests for fact-check endpoint with mocked OpenRouter."""
 
-    @pytest.mark.asyncio
-    @respx.mock
-    async def test_fact_check_full_flow(self, respx_mock):
-        """Test full fact-check flow with mocked OpenRouter API."""
-        # Track call count to return different responses
-        call_count = {"count": 0}
-
-        def mock_openrouter(request):
-            call_count["count"] += 1
-            if call_count["count"] == 1:
-                # First call: websearch
-                return Response(200, json=WEBSEARCH_RESPONSE)
-            else:
-                # Second call: evaluation
-                return Response(200, json=EVALUATION_RESPONSE)
-
-        respx_mock.post("https://openrouter.ai/api/v1/chat/completions").mock(
-            side_effect=mock_openrouter
+    @pytest.fixture(autouse=True)
+    def openrouter(self):
+        """Activate the prebuilt OpenRouter mock for each test."""
+        route = OPENROUTER["completions"]
+        route.side_effect = None
+        route.return_value = None
+        with OPENROUTER:
+            yield route
+        OPENROUTER.reset()
+
+    async def test_fact_check_full_flow(self, client, monkeypatch):
+        """Test full fact-check flow with stubbed OpenRouter adapters."""
+
+        async def search(self, **kwargs):
+            return SEARCH_RESULTS
+
+        async def make_request(self, **kwargs):
+            return CLAIM_REVIEW
+
+        monkeypatch.setattr(OpenRouterWebsearchAdapter, "search", search)
+        monkeypatch.setattr(OpenRouterAdapter, "make_request", make_request)
+
+        response = await client.post(
+            "/api/v1/fact-check", json={"query": "The sky is blue"}
         )
 
-        async with AsyncClient(
-            transport=ASGITransport(app=app), base_url="http://test"
-        ) as client:
-            response = await client.post(
-                "/api/v1/fact-check", json={"query": "The sky is blue"}
-            )
+        # Should succeed
+        assert response.status_code == 200
+
+        # Verify response structure
+        data = orjson.loads(response.content)
+        assert data["success"] is True
+        assert data["data"]["claimReviewed"] == "The sky is blue"
 
-            # Should succeed
-            assert response.status_code == 200
+    async def test_fact_check_full_flow_over_http(self, openrouter, client):
+        """Test full flow through the HTTP client and structured-output parsing."""
+        # First call: websearch, second call: evaluation
+        openrouter.side_effect = [
+            Response(200, content=WEBSEARCH_BYTES, headers=JSON_HEADERS),
+            Response(200, content=EVALUATION_BYTES, headers=JSON_HEADERS),
+        ]
 
-            # Verify response structure
-            data = response.json()
-            assert data["success"] is True
-            assert "data" in data
+        response = await client.post(
+            "/api/v1/fact-check", json={"query": "Is the sky blue?"}
+        )
+
+        assert response.status_code == 200
+        assert openrouter.call_count == 2
+        data = orjson.loads(response.content)
+        assert data["success"] is True
+        assert data["data"] == CLAIM_REVIEW.model_dump(mode="json", by_alias=True)
 
-    @pytest.mark.asyncio
-    @respx.mock
-    async def test_fact_check_api_error_handled(self, respx_mock):
+    async def test_fact_check_api_error_handled(self, openrouter, client, monkeypatch):
         """Test that API errors are handled gracefully."""
-        respx_mock.post("https://openrouter.ai/api/v1/chat/completions").mock(
-            return_value=Response(500, json={"error": "Internal server error"})
+        # 500s are retried; skip the backoff sleeps
+        monkeypatch.setattr(
+            "app.utils.retry_decorator.asyncio.sleep", RecordingAsyncMock()
         )
+        openrouter.return_value = Response(500, json={"error": "Internal server error"})
 
-        async with AsyncClient(
-            transport=ASGITransport(app=app), base_url="http://test"
-        ) as client:
-            response = await client.post(
-                "/api/v1/fact-check", json={"query": "Test claim"}
-            )
+        response = await client.post(
+            "/api/v1/fact-check", json={"query": "Test claim"}
+        )
 
-            # Should return error response
-            assert response.status_code == 500
+        # Should return error response after the websearch retries
+        assert response.status_code == 500
+        assert openrouter.call_count == 4
+
+    async def test_malformed_model_output_is_server_error(self, openrouter, client):
+        """Test that model output failing validation is a 500, not a 422."""
+        openrouter.return_value = Response(
+            200,
+            json={"choices": [{"message": {"content": '{"results": "none"}'}}]},
+        )
+
+        response = await client.post(
+            "/api/v1/fact-check", json={"query": "Malformed output claim"}
+        )
+
+        assert response.status_code == 500
+        assert orjson.loads(response.content)["success"] is False
 
 
 class TestResponseTransformation:
     """Tests for response transformation middleware."""
 
-    @pytest.mark.asyncio
-    async def test_health_not_transformed(self):
+    async def test_health_not_transformed(self, client):
         """Test that health endpoint is not transformed."""
-        async with AsyncClient(
-            transport=ASGITransport(app=app), base_url="http://test"
-        ) as client:
-            response = await client.get("/health")
-
-            # Health should return raw response, not wrapped
-            data = response.json()
-            assert "status" in data
-            assert "success" not in data  # Not transformed
-
-    @pytest.mark.asyncio
-    async def test_validation_error_transformed(self):
+        response = await client.get("/health")
+
+        # Health should return raw response, not wrapped
+        data = orjson.loads(response.content)
+        assert "status" in data
+        assert "success" not in data  # Not transformed
+
+    async def test_validation_error_transformed(self, client):
         """Test that validation errors are transformed."""
-        async with AsyncClient(
-            transport=ASGITransport(app=app), base_url="http://test"
-        ) as client:
-            response = await client.post("/api/v1/fact-check", json={"query": ""})
-
-            data = response.json()
-            assert data["success"] is False
-            assert "error" in data
+        response = await client.post("/api/v1/fact-check", json={"query": ""})
+
+        data = orjson.loads(response.content)
+        assert data["success"] is False
+        assert "error" in data
@@ -0,0 +1,37 @@
+"""Shared fixtures for unit tests."""
+
+import pytest
+
+from app.models.response import ClaimReview, ItemReviewed, Organization, Rating
+
+
+# Response models are frozen, so one instance per session is safe to share.
+@pytest.fixture(scope="session")
+def default_rating():
+    """Valid Rating with default best/worst values."""
+    return Rating(ratingValue="5", alternateName="True")
+
+
+@pytest.fixture(scope="session")
+def default_org():
+    """Organization with default values."""
+    return Organization()
+
+
+@pytest.fixture(scope="session")
+def default_item_reviewed():
+    """ItemReviewed with a single source URL."""
+    return ItemReviewed(url=["https://source.com"])
+
+
+@pytest.fixture(scope="session")
+def default_claim_review(default_rating, default_item_reviewed):
+    """Valid ClaimReview with default author."""
+    return ClaimReview(
+        claimReviewed="Test claim",
+        datePublished="2025-01-01",
+        reviewRating=default_rating,
+        url="https://fact-check.wordlift.io/review/test",
+        reviewBody="This claim is verified as true.",
+        itemReviewed=default_item_reviewed,
+    )
@@ -0,0 +1,84 @@
+"""Unit tests for BatchFactCheckService."""
+
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+
+from app.services.batch_fact_check_service import BatchFactCheckService
+from app.models.request import FactCheckRequest
+from tests.helpers import RecordingAsyncMock
+
+
+class TestBatchFactCheckService:
+    """Tests for BatchFactCheckService."""
+
+    async def test_fact_check_batch_calls_service_per_request(self, mock_claim_review):
+        """Test that each request is fact-checked once."""
+        service = SimpleNamespace(fact_check=RecordingAsyncMock(mock_claim_review))
+        batch_service = BatchFactCheckService(service=service)
+        requests = [FactCheckRequest(query="Claim one"), FactCheckRequest(query="Claim two")]
+
+        results = await batch_service.fact_check_batch(requests=requests)
+
+        assert service.fact_check.call_count == 2
+        assert results == [mock_claim_review, mock_claim_review]
+
+    async def test_fact_check_batch_preserves_order(self):
+        """Test that results are returned in request order."""
+        service = SimpleNamespace(
+            fact_check=RecordingAsyncMock(side_effect=lambda *, request: request.query)
+        )
+        batch_service = BatchFactCheckService(service=service)
+        requests = [FactCheckRequest(query=f"Claim {i}") for i in range(5)]
+
+        results = await batch_service.fact_check_batch(requests=requests)
+
+        assert results == [f"Claim {i}" for i in range(5)]
+
+    async def test_fact_check_batch_cancels_siblings_on_failure(self):
+        """Test that a failing claim cancels the claims still running."""
+        cancelled = []
+
+        async def fact_check(*, request):
+            if request.query == "Bad claim":
+                raise ValueError("upstream error")
+            try:
+                await asyncio.Event().wait()
+            except asyncio.CancelledError:
+                cancelled.append(request.query)
+                raise
+
+        batch_service = BatchFactCheckService(
+            service=SimpleNamespace(fact_check=fact_check)
+        )
+        requests = [FactCheckRequest(query="Slow claim"), FactCheckRequest(query="Bad claim")]
+
+        with pytest.raises(ValueError):
+            await batch_service.fact_check_batch(requests=requests)
+        await asyncio.sleep(0)
+
+        assert cancelled == ["Slow claim"]
+
+    async def test_fact_check_batch_takes_one_slot_per_claim(self):
+        """Test that claims in a batch are bounded by the admission slots."""
+        running = []
+        peak = []
+
+        async def fact_check(*, request):
+            running.append(request)
+            peak.append(len(running))
+            await asyncio.sleep(0)
+            running.remove(request)
+            return request.query
+
+        batch_service = BatchFactCheckService(
+            service=SimpleNamespace(fact_check=fact_check),
+            slots=asyncio.Semaphore(2),
+        )
+        requests = [FactCheckRequest(query=f"Claim {i}") for i in range(5)]
+
+        results = await batch_service.fact_check_batch(requests=requests)
+
+        assert results == [f"Claim {i}" for i in range(5)]
+        assert max(peak) == 2
@@ -0,0 +1,116 @@
+"""Unit tests for the async response cache."""
+
+import asyncio
+import contextvars
+
+import pytest
+
+from app.utils.cache import AsyncTTLCache, make_cache_key
+
+
+REQUEST_ID = contextvars.ContextVar("request_id", default=None)
+
+
+class TestMakeCacheKey:
+    """Tests for make_cache_key."""
+
+    def test_same_parts_same_key(self):
+        """Test that identical parts produce identical keys."""
+        messages = [{"role": "user", "content": "The sky is blue"}]
+        assert make_cache_key("model", messages, None) == make_cache_key(
+            "model", messages, None
+        )
+
+    def test_different_parts_different_key(self):
+        """Test that different parts produce different keys."""
+        assert make_cache_key("model", "a") != make_cache_key("model", "b")
+
+
+class TestAsyncTTLCache:
+    """Tests for AsyncTTLCache."""
+
+    async def test_hit_skips_factory(self):
+        """Test that a cached value is returned without calling the factory."""
+        cache = AsyncTTLCache(maxsize=10, ttl=60)
+        calls = []
+
+        async def factory():
+            calls.append(1)
+            return "result"
+
+        assert await cache.get_or_set("key", factory) == "result"
+        assert await cache.get_or_set("key", factory) == "result"
+        assert len(calls) == 1
+
+    async def test_concurrent_misses_share_one_call(self):
+        """Test that concurrent misses on one key coalesce to a single call."""
+        cache = AsyncTTLCache(maxsize=10, ttl=60)
+        calls = []
+
+        async def factory():
+            calls.append(1)
+            await asyncio.sleep(0.01)
+            return "result"
+
+        results = await asyncio.gather(
+            *[cache.get_or_set("key", factory) for _ in range(5)]
+        )
+
+        assert results == ["result"] * 5
+        assert len(calls) == 1
+
+    async def test_failures_are_not_cached(self):
+        """Test that a failed call is retried on the next lookup."""
+        cache = AsyncTTLCache(maxsize=10, ttl=60)
+
+        async def failing():
+            raise ValueError("upstream error")
+
+        async def succeeding():
+            return "result"
+
+        with pytest.raises(ValueError):
+            await cache.get_or_set("key", failing)
+
+        assert len(cache) == 0
+        assert await cache.get_or_set("key", succeeding) == "result"
+
+    async def test_cancelled_caller_does_not_cancel_waiters(self):
+        """Test that waiters still get the result when the first caller is cancelled."""
+        cache = AsyncTTLCache(maxsize=10, ttl=60)
+        release = asyncio.Event()
+        calls = []
+
+        async def factory():
+            calls.append(1)
+            await release.wait()
+            return "result"
+
+        leader = asyncio.create_task(cache.get_or_set("key", factory))
+        await asyncio.sleep(0)
+        followers = [
+            asyncio.create_task(cache.get_or_set("key", factory)) for _ in range(3)
+        ]
+        await asyncio.sleep(0)
+
+        leader.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await leader
+
+        release.set()
+        assert await asyncio.gather(*followers) == ["result"] * 3
+        assert len(calls) == 1
+        assert await cache.get_or_set("key", factory) == "result"
+
+    async def test_factory_runs_without_caller_context(self):
+        """Test that shared work does not inherit the first caller's context."""
+        cache = AsyncTTLCache(maxsize=10, ttl=60)
+
+        async def factory():
+            return REQUEST_ID.get()
+
+        token = REQUEST_ID.set("caller-1")
+        try:
+            assert await cache.get_or_set("key", factory) is None
+        finally:
+            REQUEST_ID.reset(token)
@@ -0,0 +1,20 @@
+"""Unit tests for date helpers."""
+
+from datetime import date
+
+from app.utils import dates
+from app.utils.dates import today_iso
+
+
+class TestTodayIso:
+    """Tests for today_iso."""
+
+    def test_returns_today_in_iso_format(self):
+        """Test that today's local date is returned as YYYY-MM-DD."""
+        assert today_iso() == date.today().isoformat()
+
+    def test_recomputes_after_cached_midnight(self, monkeypatch):
+        """Test that a stale cached date is refreshed."""
+        monkeypatch.setattr(dates, "_today", ("2000-01-01", 0.0))
+
+        assert today_iso() == date.today().isoformat()
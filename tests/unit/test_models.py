@@ -7,6 +7,9 @@ from app.models.request import FactCheckRequest
 from app.models.response import ClaimReview, Rating, ItemReviewed, Organization
 from app.models.internal import PipelineParams
 
+MAX_QUERY = "x" * 1000
+LONG_QUERY = MAX_QUERY + "x"
+
 
 class TestFactCheckRequest:
     """Tests for FactCheckRequest model."""
@@ -20,26 +23,26 @@ class TestFactCheckRequest:
         """Test that empty query is rejected."""
         with pytest.raises(ValidationError) as exc_info:
             FactCheckRequest(query="")
-        assert "String should have at least 1 character" in str(exc_info.value)
+        assert exc_info.value.errors()[0]["type"] == "string_too_short"
 
     def test_query_max_length(self):
         """Test that query exceeding max length is rejected."""
         with pytest.raises(ValidationError) as exc_info:
-            FactCheckRequest(query="x" * 1001)
-        assert "String should have at most 1000 characters" in str(exc_info.value)
+            FactCheckRequest(query=LONG_QUERY)
+        assert exc_info.value.errors()[0]["type"] == "string_too_long"
 
     def test_query_at_max_length(self):
         """Test query at exactly max length is accepted."""
-        req = FactCheckRequest(query="x" * 1000)
+        req = FactCheckRequest(query=MAX_QUERY)
         assert len(req.query) == 1000
 
 
 class TestRating:
     """Tests for Rating model."""
 
-    def test_valid_rating(self):
+    def test_valid_rating(self, default_rating):
         """Test creating a valid rating."""
-        rating = Rating(ratingValue="5", alternateName="True")
+        rating = default_rating
         assert rating.ratingValue == "5"
         assert rating.alternateName == "True"
         assert rating.bestRating == "5"
@@ -60,19 +63,29 @@ class TestItemReviewed:
         item = ItemReviewed(url=["https://example.com", "https://test.com"])
         assert len(item.url) == 2
 
-    def test_item_reviewed_urls(self):
+    def test_item_reviewed_urls(self, default_item_reviewed):
         """Test item reviewed contains provided URLs."""
-        item = ItemReviewed(url=["https://example.com"])
-        assert "https://example.com" in item.url
+        assert "https://source.com" in default_item_reviewed.url
+
+    def test_item_reviewed_dedupes_urls(self):
+        """Test duplicate URLs are dropped in first-seen order."""
+        item = ItemReviewed(
+            url=["https://a.com", "https://b.com", "https://a.com"]
+        )
+        assert item.url == ("https://a.com", "https://b.com")
+
+    def test_item_reviewed_rejects_string_url(self):
+        """Test a bare string is rejected rather than split into characters."""
+        with pytest.raises(ValidationError):
+            ItemReviewed(url="https://a.com")
 
 
 class TestOrganization:
     """Tests for Organization model."""
 
-    def test_default_organization(self):
+    def test_default_organization(self, default_org):
         """Test default organization values."""
-        org = Organization()
-        assert org.name == "WordLift"
+        assert default_org.name == "WordLift"
 
     def test_custom_organization_name(self):
         """Test organization with custom name."""
@@ -83,30 +96,15 @@ class TestOrganization:
 class TestClaimReview:
     """Tests for ClaimReview model."""
 
-    def test_valid_claim_review(self):
+    def test_valid_claim_review(self, default_claim_review):
         """Test creating a valid claim review."""
-        review = ClaimReview(
-            claimReviewed="Test claim",
-            datePublished="2025-01-01",
-            reviewRating=Rating(ratingValue="5", alternateName="True"),
-            url="https://fact-check.wordlift.io/review/test",
-            reviewBody="This claim is verified as true.",
-            itemReviewed=ItemReviewed(url=["https://source.com"]),
-        )
+        review = default_claim_review
         assert review.claimReviewed == "Test claim"
         assert review.reviewRating.ratingValue == "5"
 
-    def test_claim_review_default_author(self):
+    def test_claim_review_default_author(self, default_claim_review):
         """Test claim review default author value."""
-        review = ClaimReview(
-            claimReviewed="Test",
-            datePublished="2025-01-01",
-            reviewRating=Rating(ratingValue="3", alternateName="Half True"),
-            url="https://example.com/review",
-            reviewBody="Test body",
-            itemReviewed=ItemReviewed(url=["https://source.com"]),
-        )
-        assert review.author.name == "WordLift"
+        assert default_claim_review.author.name == "WordLift"
 
     def test_claim_review_with_custom_author(self):
         """Test claim review with custom author."""
@@ -121,6 +119,16 @@ class TestClaimReview:
         )
         assert review.author.name == "CustomOrg"
 
+    def test_claim_review_dumps_schema_org_keys(self, default_claim_review):
+        """Test that schema.org @context/@type keys are emitted by alias."""
+        data = default_claim_review.model_dump(by_alias=True)
+
+        assert data["@context"] == "http://schema.org"
+        assert data["@type"] == "ClaimReview"
+        assert data["author"]["@type"] == "Organization"
+        assert data["reviewRating"]["@type"] == "Rating"
+        assert data["itemReviewed"]["@type"] == "CreativeWork"
+
 
 class TestPipelineParams:
     """Tests for PipelineParams model."""
@@ -131,23 +139,25 @@ class TestPipelineParams:
         assert params.query == "Test query"
         assert params.max_results == 5
 
+    def test_params_are_frozen(self):
+        """Test that params cannot be mutated once built."""
+        params = PipelineParams(query="Test")
+        with pytest.raises(ValidationError):
+            params.max_results = 3
+
     def test_default_max_results(self):
         """Test default max_results value."""
         params = PipelineParams(query="Test")
         assert params.max_results == 5
 
-    def test_max_results_bounds(self):
-        """Test max_results validation bounds."""
+    @pytest.mark.parametrize("max_results", [0, 11])
+    def test_max_results_out_of_bounds(self, max_results):
+        """Test max_results outside 1-10 is rejected."""
         with pytest.raises(ValidationError):
-            PipelineParams(query="Test", max_results=0)
+            PipelineParams(query="Test", max_results=max_results)
 
-        with pytest.raises(ValidationError):
-            PipelineParams(query="Test", max_results=11)
-
-    def test_max_results_at_bounds(self):
+    @pytest.mark.parametrize("max_results", [1, 10])
+    def test_max_results_at_bounds(self, max_results):
         """Test max_results at valid bounds."""
-        params_min = PipelineParams(query="Test", max_results=1)
-        assert params_min.max_results == 1
-
-        params_max = PipelineParams(query="Test", max_results=10)
-        assert params_max.max_results == 10
+        params = PipelineParams(query="Test", max_results=max_results)
+        assert params.max_results == max_results
@@ -1,13 +1,47 @@
 """Unit tests for FactCheckPipeline."""
 
 import pytest
-from unittest.mock import AsyncMock, patch
+import pytest_asyncio
 from datetime import datetime
 
 from app.pipelines.fact_check_pipeline import FactCheckPipeline
 from app.adapters.openrouter_websearch_adapter import WebsearchResponse
 from app.models.response import ClaimReview, Rating, ItemReviewed
-from app.models.internal import PipelineParams
+from tests.helpers import pipeline_params
+
+# Search results are validated once at import and only read by the tests
+TEST_RESULT = WebsearchResponse(
+    title="Test",
+    url="https://test.com",
+    content="Test content",
+)
+NASA_RESULT = WebsearchResponse(
+    title="NASA Article",
+    url="https://nasa.gov/earth",
+    content="The Earth is an oblate spheroid.",
+)
+SCIENCE_DAILY_RESULT = WebsearchResponse(
+    title="Science Daily",
+    url="https://sciencedaily.com/earth",
+    content="Scientific evidence confirms Earth's shape.",
+)
+
+
+@pytest.fixture(scope="module")
+def pipeline():
+    """Pipeline shared by tests that don't replace its adapters."""
+    return FactCheckPipeline()
+
+
+@pytest_asyncio.fixture(scope="module")
+async def executed_call(mock_websearch_adapter, mock_openrouter_adapter):
+    """Evaluation call recorded from a single pipeline run, shared read-only."""
+    pipeline = FactCheckPipeline()
+    pipeline.websearch_adapter = mock_websearch_adapter
+    pipeline.openrouter_adapter = mock_openrouter_adapter
+
+    await pipeline.execute(params=pipeline_params("Test claim", 3))
+    return mock_openrouter_adapter.make_request.call_args
 
 
 class TestFactCheckPipeline:
@@ -21,10 +55,9 @@ class TestFactCheckPipeline:
         pipeline.openrouter_adapter = mock_openrouter_adapter
         return pipeline
 
-    @pytest.mark.asyncio
     async def test_execute_calls_both_steps(self, pipeline_with_mocks):
         """Test that execute calls websearch and evaluation."""
-        params = PipelineParams(query="The sky is blue", max_results=5)
+        params = pipeline_params("The sky is blue")
 
         result = await pipeline_with_mocks.execute(params=params)
 
@@ -39,18 +72,9 @@ class TestFactCheckPipeline:
         assert isinstance(result, ClaimReview)
         assert result.claimReviewed == "The sky is blue"
 
-    @pytest.mark.asyncio
-    async def test_execute_passes_search_results_to_evaluation(
-        self, pipeline_with_mocks, mock_websearch_response
-    ):
+    def test_execute_passes_search_results_to_evaluation(self, executed_call):
         """Test that search results are passed to evaluation."""
-        params = PipelineParams(query="Test claim", max_results=3)
-
-        await pipeline_with_mocks.execute(params=params)
-
-        # Get the call arguments for make_request
-        call_args = pipeline_with_mocks.openrouter_adapter.make_request.call_args
-        messages = call_args.kwargs["messages"]
+        messages = executed_call.kwargs["messages"]
 
         # Verify user message contains search results
         user_message = messages[1]["content"]
@@ -58,73 +82,55 @@ class TestFactCheckPipeline:
         assert "NASA confirms sky is blue" in user_message
         assert "https://nasa.gov/sky" in user_message
 
-    @pytest.mark.asyncio
-    async def test_execute_uses_correct_model(self, pipeline_with_mocks):
+    def test_execute_uses_correct_model(self, executed_call):
         """Test that correct model is used for evaluation."""
-        params = PipelineParams(query="Test", max_results=5)
-
-        await pipeline_with_mocks.execute(params=params)
+        assert executed_call.kwargs["model"] == "openai/gpt-5.2"
+        assert executed_call.kwargs["output_type"] == ClaimReview
 
-        call_args = pipeline_with_mocks.openrouter_adapter.make_request.call_args
-        assert call_args.kwargs["model"] == "openai/gpt-5.2"
-        assert call_args.kwargs["output_type"] == ClaimReview
-
-    @pytest.mark.asyncio
-    async def test_execute_includes_system_prompt(self, pipeline_with_mocks):
+    def test_execute_includes_system_prompt(self, executed_call):
         """Test that system prompt is included in messages."""
-        params = PipelineParams(query="Test", max_results=5)
-
-        await pipeline_with_mocks.execute(params=params)
-
-        call_args = pipeline_with_mocks.openrouter_adapter.make_request.call_args
-        messages = call_args.kwargs["messages"]
+        messages = executed_call.kwargs["messages"]
 
         assert messages[0]["role"] == "system"
         assert "FactCheckExpert" in messages[0]["content"]
         assert "rating_scale" in messages[0]["content"].lower()
 
+    async def test_execute_uses_class_prompt_mapping(
+        self, pipeline_with_mocks, monkeypatch
+    ):
+        """Test that overriding the class prompt mapping changes the prompt."""
+        monkeypatch.setattr(
+            FactCheckPipeline,
+            "prompt_mapping",
+            {"evaluation": "Custom for {current_date}"},
+        )
+
+        await pipeline_with_mocks.execute(params=pipeline_params("The sky is blue"))
+
+        messages = pipeline_with_mocks.openrouter_adapter.make_request.call_args.kwargs[
+            "messages"
+        ]
+        assert messages[0]["content"].startswith("Custom for ")
+
 
 class TestBuildUserPrompt:
     """Tests for _build_user_prompt method."""
 
-    def test_build_user_prompt_includes_claim(self):
+    def test_build_user_prompt_includes_claim(self, pipeline):
         """Test that user prompt includes the claim."""
-        pipeline = FactCheckPipeline()
-        search_results = [
-            WebsearchResponse(
-                title="Test",
-                url="https://test.com",
-                content="Test content",
-            )
-        ]
-
         prompt = pipeline._build_user_prompt(
             query="The Earth is round",
-            search_results=search_results,
+            search_results=[TEST_RESULT],
             current_date="2025-01-01",
         )
 
         assert "The Earth is round" in prompt
 
-    def test_build_user_prompt_includes_search_results(self):
+    def test_build_user_prompt_includes_search_results(self, pipeline):
         """Test that user prompt includes search results."""
-        pipeline = FactCheckPipeline()
-        search_results = [
-            WebsearchResponse(
-                title="NASA Article",
-                url="https://nasa.gov/earth",
-                content="The Earth is an oblate spheroid.",
-            ),
-            WebsearchResponse(
-                title="Science Daily",
-                url="https://sciencedaily.com/earth",
-                content="Scientific evidence confirms Earth's shape.",
-            ),
-        ]
-
         prompt = pipeline._build_user_prompt(
             query="Test",
-            search_results=search_results,
+            search_results=[NASA_RESULT, SCIENCE_DAILY_RESULT],
             current_date="2025-01-01",
         )
 
@@ -133,10 +139,8 @@ class TestBuildUserPrompt:
         assert "oblate spheroid" in prompt
         assert "Science Daily" in prompt
 
-    def test_build_user_prompt_includes_date(self):
+    def test_build_user_prompt_includes_date(self, pipeline):
         """Test that user prompt includes current date."""
-        pipeline = FactCheckPipeline()
-
         prompt = pipeline._build_user_prompt(
             query="Test",
             search_results=[],
@@ -145,10 +149,8 @@ class TestBuildUserPrompt:
 
         assert "2025-12-25" in prompt
 
-    def test_build_user_prompt_handles_empty_results(self):
+    def test_build_user_prompt_handles_empty_results(self, pipeline):
         """Test that user prompt handles empty search results."""
-        pipeline = FactCheckPipeline()
-
         prompt = pipeline._build_user_prompt(
             query="Test claim",
             search_results=[],
@@ -162,11 +164,11 @@ class TestBuildUserPrompt:
 class TestSearchForEvidence:
     """Tests for _search_for_evidence method."""
 
-    @pytest.mark.asyncio
-    async def test_search_for_evidence_calls_adapter(self, mock_websearch_adapter):
+    async def test_search_for_evidence_calls_adapter(
+        self, pipeline, mock_websearch_adapter, monkeypatch
+    ):
         """Test that search calls the websearch adapter."""
-        pipeline = FactCheckPipeline()
-        pipeline.websearch_adapter = mock_websearch_adapter
+        monkeypatch.setattr(pipeline, "websearch_adapter", mock_websearch_adapter)
 
         results = await pipeline._search_for_evidence(
             query="Test query",
@@ -0,0 +1,170 @@
+"""Unit tests for the raw OpenRouter chat-completions client."""
+
+import json
+
+import pytest
+import respx
+from httpx import Response
+
+from app.adapters.raw_openrouter import (
+    OpenRouterAPIError,
+    OpenRouterTransientError,
+    chat_completion,
+    parse_retry_after,
+    response_format_for,
+    strict_json_schema,
+)
+from app.adapters.openrouter_websearch_adapter import WebsearchResponseList
+from app.models.response import ClaimReview
+
+COMPLETIONS_URL = "https://openrouter.ai/api/v1/chat/completions"
+MESSAGES = [{"role": "user", "content": "Test"}]
+
+
+def completion(content: str) -> dict:
+    """Build a minimal chat completion body."""
+    return {"choices": [{"message": {"role": "assistant", "content": content}}]}
+
+
+class TestResponseFormatFor:
+    """Tests for response_format_for."""
+
+    def test_builds_strict_json_schema(self):
+        """Test that structured output uses a strict json_schema format."""
+        response_format = response_format_for(WebsearchResponseList)
+
+        assert response_format["type"] == "json_schema"
+        assert response_format["json_schema"]["name"] == "WebsearchResponseList"
+        assert response_format["json_schema"]["strict"] is True
+        assert response_format["json_schema"]["schema"]["additionalProperties"] is False
+
+    def test_strict_schema_requires_every_property(self):
+        """Test that nested objects list all properties as required."""
+        schema = strict_json_schema(ClaimReview)
+        rating = schema["$defs"]["Rating"]
+
+        assert schema["required"] == list(schema["properties"])
+        assert "bestRating" in rating["required"]
+        assert rating["additionalProperties"] is False
+
+    def test_schema_is_built_once_per_model(self):
+        """Test that the response format is cached per output type."""
+        assert response_format_for(WebsearchResponseList) is response_format_for(
+            WebsearchResponseList
+        )
+
+
+class TestChatCompletion:
+    """Tests for chat_completion."""
+
+    @respx.mock
+    async def test_returns_content(self, respx_mock):
+        """Test that plain completions return the message content."""
+        route = respx_mock.post(COMPLETIONS_URL).mock(
+            return_value=Response(200, json=completion("Hello"))
+        )
+
+        message = await chat_completion(model="test/model", messages=MESSAGES)
+
+        assert message.content == "Hello"
+        assert message.parsed is None
+        sent = json.loads(route.calls.last.request.content)
+        assert sent == {"model": "test/model", "messages": MESSAGES}
+        assert route.calls.last.request.headers["Authorization"].startswith("Bearer ")
+
+    @respx.mock
+    async def test_parses_structured_output(self, respx_mock):
+        """Test that structured output is validated into the output type."""
+        content = json.dumps(
+            {"results": [{"title": "T", "url": "https://t.com", "content": "C"}]}
+        )
+        route = respx_mock.post(COMPLETIONS_URL).mock(
+            return_value=Response(200, json=completion(content))
+        )
+
+        message = await chat_completion(
+            model="test/model",
+            messages=MESSAGES,
+            output_type=WebsearchResponseList,
+        )
+
+        assert isinstance(message.parsed, WebsearchResponseList)
+        assert message.parsed.results[0].url == "https://t.com"
+        sent = json.loads(route.calls.last.request.content)
+        assert sent["response_format"]["type"] == "json_schema"
+
+    @respx.mock
+    async def test_error_status_raises(self, respx_mock):
+        """Test that an error status raises OpenRouterAPIError."""
+        respx_mock.post(COMPLETIONS_URL).mock(
+            return_value=Response(
+                429, json={"error": "rate limited"}, headers={"Retry-After": "7"}
+            )
+        )
+
+        with pytest.raises(OpenRouterAPIError) as exc_info:
+            await chat_completion(model="test/model", messages=MESSAGES)
+
+        assert exc_info.value.status_code == 429
+        assert exc_info.value.retry_after == 7.0
+        assert isinstance(exc_info.value, OpenRouterTransientError)
+
+    @respx.mock
+    async def test_client_error_is_not_transient(self, respx_mock):
+        """Test that non-retryable statuses are not marked transient."""
+        respx_mock.post(COMPLETIONS_URL).mock(
+            return_value=Response(400, json={"error": "bad request"})
+        )
+
+        with pytest.raises(OpenRouterAPIError) as exc_info:
+            await chat_completion(model="test/model", messages=MESSAGES)
+
+        assert not isinstance(exc_info.value, OpenRouterTransientError)
+
+    @respx.mock
+    async def test_string_error_body_raises_api_error(self, respx_mock):
+        """Test that a 200 body with a non-dict error raises OpenRouterAPIError."""
+        respx_mock.post(COMPLETIONS_URL).mock(
+            return_value=Response(200, json={"error": "upstream exploded"})
+        )
+
+        with pytest.raises(OpenRouterAPIError) as exc_info:
+            await chat_completion(model="test/model", messages=MESSAGES)
+
+        assert "upstream exploded" in str(exc_info.value)
+
+    @pytest.mark.parametrize(
+        "body",
+        [{}, {"choices": []}, {"choices": [{}]}],
+        ids=["no_choices", "empty_choices", "no_message"],
+    )
+    @respx.mock
+    async def test_missing_message_is_empty_response(self, respx_mock, body):
+        """Test that bodies without a message yield no content or parsed value."""
+        respx_mock.post(COMPLETIONS_URL).mock(return_value=Response(200, json=body))
+
+        message = await chat_completion(
+            model="test/model",
+            messages=MESSAGES,
+            output_type=WebsearchResponseList,
+        )
+
+        assert message.content is None
+        assert message.parsed is None
+
+
+class TestParseRetryAfter:
+    """Tests for parse_retry_after."""
+
+    def test_parses_delay_seconds(self):
+        """Test that a delay-seconds header is returned as a float."""
+        assert parse_retry_after("12") == 12.0
+
+    def test_parses_past_http_date_as_zero(self):
+        """Test that an HTTP date in the past means retry immediately."""
+        assert parse_retry_after("Wed, 21 Oct 2015 07:28:00 GMT") == 0.0
+
+    def test_missing_or_invalid_returns_none(self):
+        """Test that absent or garbage headers fall back to backoff."""
+        assert parse_retry_after(None) is None
+        assert parse_retry_after("soon") is None
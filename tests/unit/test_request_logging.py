@@ -0,0 +1,108 @@
+"""Unit tests for RequestLoggingMiddleware."""
+
+import uuid
+from types import SimpleNamespace
+
+import pytest
+from fastapi import FastAPI, HTTPException
+from fastapi.testclient import TestClient
+
+from app.api.middlewares import request_logging
+from app.api.middlewares.request_logging import RequestLoggingMiddleware
+from app.config.settings import settings
+
+
+def build_client() -> TestClient:
+    """Build a test client for an app wrapped in the logging middleware."""
+    app = FastAPI()
+
+    @app.get("/ok")
+    async def ok():
+        return {"value": 1}
+
+    @app.get("/health")
+    async def health():
+        return {"status": "healthy"}
+
+    @app.get("/missing")
+    async def missing():
+        raise HTTPException(status_code=404)
+
+    @app.get("/boom")
+    async def boom():
+        raise RuntimeError("boom")
+
+    app.add_middleware(RequestLoggingMiddleware)
+    return TestClient(app, raise_server_exceptions=False)
+
+
+@pytest.fixture
+def logs(monkeypatch):
+    """Record the middleware's log calls as (level, event, fields)."""
+    records = []
+    monkeypatch.setattr(
+        request_logging,
+        "logger",
+        SimpleNamespace(
+            info=lambda event, **kw: records.append(("info", event, kw)),
+            error=lambda event, **kw: records.append(("error", event, kw)),
+        ),
+    )
+    return records
+
+
+class TestRequestLoggingMiddleware:
+    """Tests for RequestLoggingMiddleware."""
+
+    def test_adds_counter_request_id(self, logs):
+        """Test that responses carry consecutive per-process request ids."""
+        client = build_client()
+
+        first = client.get("/ok").headers["X-Request-ID"]
+        second = client.get("/ok").headers["X-Request-ID"]
+
+        prefix = request_logging._REQUEST_ID_PREFIX
+        assert first.startswith(prefix) and second.startswith(prefix)
+        assert int(second[len(prefix):], 16) == int(first[len(prefix):], 16) + 1
+
+    def test_uses_uuid4_when_global_ids_required(self, logs, monkeypatch):
+        """Test that uuid4 ids are used when global uniqueness is required."""
+        monkeypatch.setattr(settings, "require_global_unique_request_id", True)
+
+        request_id = build_client().get("/ok").headers["X-Request-ID"]
+
+        assert uuid.UUID(hex=request_id).version == 4
+
+    def test_logs_success_with_status(self, logs):
+        """Test that successful requests are logged at info level."""
+        build_client().get("/ok")
+
+        level, event, fields = logs[-1]
+        assert (level, event, fields["status_code"]) == ("info", "Request success", 200)
+        assert fields["duration_ms"] >= 0
+
+    def test_logs_error_status_as_failure(self, logs):
+        """Test that error responses are logged as failed with their status."""
+        build_client().get("/missing")
+
+        level, event, fields = logs[-1]
+        assert (level, event, fields["status_code"]) == ("error", "Request failed", 404)
+
+    def test_logs_unhandled_exception(self, logs):
+        """Test that unhandled exceptions are logged and reported as 500."""
+        response = build_client().get("/boom")
+
+        assert response.status_code == 500
+        assert [(level, event) for level, event, _ in logs] == [
+            ("error", "Request error"),
+            ("error", "Request failed"),
+        ]
+        assert logs[-1][2]["status_code"] == 500
+
+    def test_health_is_not_logged(self, logs):
+        """Test that health checks skip logging and request ids."""
+        response = build_client().get("/health")
+
+        assert response.status_code == 200
+        assert "X-Request-ID" not in response.headers
+        assert logs == []
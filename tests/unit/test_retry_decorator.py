@@ -0,0 +1,97 @@
+"""Unit tests for the async retry decorator."""
+
+import pytest
+
+from app.adapters.raw_openrouter import (
+    TRANSIENT_ERRORS,
+    OpenRouterAPIError,
+    OpenRouterTransientError,
+)
+from app.utils.retry_decorator import retry_with_exponential_backoff_async
+from tests.helpers import RecordingAsyncMock
+
+
+@pytest.fixture
+def sleep(monkeypatch):
+    """Record retry delays instead of sleeping."""
+    sleep = RecordingAsyncMock()
+    monkeypatch.setattr("app.utils.retry_decorator.asyncio.sleep", sleep)
+    return sleep
+
+
+def failing(*errors, result="ok"):
+    """Build a coroutine function raising errors in turn, then returning result."""
+    remaining = list(errors)
+
+    async def func():
+        func.attempts += 1
+        if remaining:
+            raise remaining.pop(0)
+        return result
+
+    func.attempts = 0
+    return func
+
+
+def delays(sleep) -> list[float]:
+    """Delays passed to the recorded sleep calls."""
+    return [call.args[0] for call in sleep.call_args_list]
+
+
+class TestRetryWithExponentialBackoff:
+    """Tests for retry_with_exponential_backoff_async."""
+
+    async def test_backoff_doubles_between_attempts(self, sleep):
+        """Test that delays double per retry and the last error is raised."""
+        func = failing(*[OpenRouterTransientError(503, "down")] * 4)
+        decorated = retry_with_exponential_backoff_async(
+            max_retries=3,
+            base_delay=1.0,
+            jitter_factor=0,
+            exceptions_to_retry=TRANSIENT_ERRORS,
+        )(func)
+
+        with pytest.raises(OpenRouterTransientError):
+            await decorated()
+
+        assert func.attempts == 4
+        assert delays(sleep) == [1.0, 2.0, 4.0]
+
+    async def test_retry_after_overrides_backoff(self, sleep):
+        """Test that a server-provided Retry-After replaces the computed delay."""
+        func = failing(OpenRouterTransientError(429, "slow down", retry_after=2.5))
+        decorated = retry_with_exponential_backoff_async(
+            max_retries=3,
+            base_delay=1.0,
+            exceptions_to_retry=TRANSIENT_ERRORS,
+        )(func)
+
+        assert await decorated() == "ok"
+        assert func.attempts == 2
+        assert delays(sleep) == [2.5]
+
+    async def test_retry_after_capped_at_max_delay(self, sleep):
+        """Test that a long Retry-After is capped at max_delay."""
+        func = failing(OpenRouterTransientError(429, "slow down", retry_after=120))
+        decorated = retry_with_exponential_backoff_async(
+            max_retries=3,
+            max_delay=10.0,
+            exceptions_to_retry=TRANSIENT_ERRORS,
+        )(func)
+
+        assert await decorated() == "ok"
+        assert delays(sleep) == [10.0]
+
+    async def test_non_transient_error_not_retried(self, sleep):
+        """Test that errors outside exceptions_to_retry are raised at once."""
+        func = failing(OpenRouterAPIError(400, "bad request"))
+        decorated = retry_with_exponential_backoff_async(
+            max_retries=3,
+            exceptions_to_retry=TRANSIENT_ERRORS,
+        )(func)
+
+        with pytest.raises(OpenRouterAPIError):
+            await decorated()
+
+        assert func.attempts == 1
+        assert sleep.call_count == 0
@@ -0,0 +1,61 @@
+"""Unit tests for StandardRoute."""
+
+from fastapi import APIRouter, FastAPI
+from fastapi.responses import StreamingResponse
+from fastapi.testclient import TestClient
+
+from app.api.exception_handlers import add_exception_handlers
+from app.api.route import StandardRoute
+
+
+def build_client() -> TestClient:
+    """Build a test client for an app using StandardRoute."""
+    router = APIRouter(route_class=StandardRoute)
+
+    @router.get("/data")
+    async def data():
+        return {"value": 1}
+
+    @router.get("/stream")
+    async def stream():
+        return StreamingResponse(iter([b"a", b"b"]), media_type="text/event-stream")
+
+    @router.get("/boom")
+    async def boom():
+        raise RuntimeError("boom")
+
+    app = FastAPI()
+    app.include_router(router)
+    add_exception_handlers(app)
+    return TestClient(app)
+
+
+class TestStandardRoute:
+    """Tests for StandardRoute."""
+
+    def test_wraps_result_in_standard_response(self):
+        """Test that endpoint results are wrapped in the standard format."""
+        response = build_client().get("/data")
+
+        assert response.status_code == 200
+        assert response.json() == {
+            "success": True,
+            "data": {"value": 1},
+            "message": "success",
+            "status_code": 200,
+        }
+
+    def test_passes_through_response_instances(self):
+        """Test that streaming responses are forwarded without wrapping."""
+        response = build_client().get("/stream")
+
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("text/event-stream")
+        assert response.content == b"ab"
+
+    def test_unhandled_exception_returns_standard_error(self):
+        """Test that unexpected errors become the standard 500 response."""
+        response = build_client().get("/boom")
+
+        assert response.status_code == 500
+        assert response.json()["error"]["code"] == "internal_server_error"
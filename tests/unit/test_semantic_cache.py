@@ -0,0 +1,135 @@
+"""Unit tests for the semantic websearch cache."""
+
+import pytest
+
+np = pytest.importorskip("numpy")
+pytest.importorskip("hnswlib")
+
+from app.utils.semantic_cache import SemanticCache  # noqa: E402
+
+# Fixed embeddings so lookups don't need the fastembed model
+VECTORS = {
+    "sky is blue": [1.0, 0.0, 0.0],
+    "the sky is blue": [0.99, 0.1, 0.0],
+    "sky is blue again": [0.995, 0.05, 0.0],
+    "grass is green": [0.0, 1.0, 0.0],
+}
+
+
+def build_cache(path=None, ttl=60.0) -> SemanticCache:
+    """Build a cache whose embeddings come from VECTORS."""
+    cache = SemanticCache(
+        value_type=list[str],
+        model_name="unused",
+        threshold=0.95,
+        max_elements=100,
+        ttl=ttl,
+        path=path,
+    )
+    cache._embed = lambda text: np.array(VECTORS[text], dtype=np.float32)
+    return cache
+
+
+def returning(value):
+    """Build a factory returning value and recording its calls."""
+
+    async def factory():
+        factory.calls += 1
+        return value
+
+    factory.calls = 0
+    return factory
+
+
+class TestSemanticCache:
+    """Tests for SemanticCache."""
+
+    async def test_similar_query_hits(self):
+        """Test that a query above the threshold reuses the cached value."""
+        cache = build_cache()
+        await cache.get_or_set("sky is blue", returning(["a"]), scope="s")
+
+        factory = returning(["b"])
+        result = await cache.get_or_set("the sky is blue", factory, scope="s")
+
+        assert result == ["a"]
+        assert factory.calls == 0
+
+    async def test_dissimilar_query_misses(self):
+        """Test that a query below the threshold calls the factory."""
+        cache = build_cache()
+        await cache.get_or_set("sky is blue", returning(["a"]), scope="s")
+
+        factory = returning(["b"])
+        result = await cache.get_or_set("grass is green", factory, scope="s")
+
+        assert result == ["b"]
+        assert factory.calls == 1
+
+    async def test_scopes_are_isolated(self):
+        """Test that entries only match lookups in their own scope."""
+        cache = build_cache()
+        await cache.get_or_set("sky is blue", returning(["a"]), scope="s")
+
+        factory = returning(["b"])
+        result = await cache.get_or_set("sky is blue", factory, scope="other")
+
+        assert result == ["b"]
+        assert factory.calls == 1
+
+    async def test_closer_entry_in_other_scope_does_not_hide_match(self):
+        """Test that a same-scope match is found past nearer foreign entries."""
+        cache = build_cache()
+        await cache.get_or_set("sky is blue", returning(["a"]), scope="s")
+        await cache.get_or_set("sky is blue again", returning(["b"]), scope="other")
+
+        factory = returning(["c"])
+        result = await cache.get_or_set("the sky is blue", factory, scope="s")
+
+        assert result == ["a"]
+        assert factory.calls == 0
+
+    async def test_expired_entries_miss(self):
+        """Test that entries past their TTL are not served."""
+        cache = build_cache(ttl=0)
+        await cache.get_or_set("sky is blue", returning(["a"]), scope="s")
+
+        factory = returning(["b"])
+        result = await cache.get_or_set("sky is blue", factory, scope="s")
+
+        assert result == ["b"]
+        assert factory.calls == 1
+
+    async def test_saved_entries_survive_reload(self, tmp_path):
+        """Test that saved entries are served by a cache loaded from disk."""
+        path = str(tmp_path / "semantic")
+        cache = build_cache(path=path)
+        await cache.get_or_set("sky is blue", returning(["a"]), scope="s")
+        cache.save()
+
+        reloaded = build_cache(path=path)
+        factory = returning(["b"])
+        result = await reloaded.get_or_set("the sky is blue", factory, scope="s")
+
+        assert len(reloaded) == 1
+        assert result == ["a"]
+        assert factory.calls == 0
+
+    async def test_reload_sees_last_complete_save(self, tmp_path):
+        """Test that caches saving to one path leave a consistent snapshot."""
+        path = str(tmp_path / "semantic")
+        first = build_cache(path=path)
+        second = build_cache(path=path)
+        # Both number their entries from label 0
+        await first.get_or_set("sky is blue", returning(["a"]), scope="s")
+        await second.get_or_set("grass is green", returning(["b"]), scope="s")
+        first.save()
+        second.save()
+
+        reloaded = build_cache(path=path)
+        grass = await reloaded.get_or_set("grass is green", returning(["x"]), scope="s")
+        sky = await reloaded.get_or_set("the sky is blue", returning(["c"]), scope="s")
+
+        # Only the last save's entries, matched against its own index
+        assert grass == ["b"]
+        assert sky == ["c"]